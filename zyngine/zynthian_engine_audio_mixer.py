@@ -45,6 +45,7 @@ class zynmixer(zynthian_engine):
 		super().__init__()
 		self.lib_zynmixer = ctypes.cdll.LoadLibrary("/zynthian/zynthian-ui/zynlibs/zynmixer/build/libzynmixer.so")
 		self.lib_zynmixer.init()
+		self._dpm_states_buf = {}  # Reusable DPM fetch buffers, keyed by channel count
 
 		self.lib_zynmixer.setLevel.argtypes = [ctypes.c_uint8, ctypes.c_float]
 		self.lib_zynmixer.getLevel.argtypes = [ctypes.c_uint8]
@@ -505,19 +506,15 @@ class zynmixer(zynthian_engine):
 	# end: Index of last channel
 	# returns: List of tuples containing (dpm_a, dpm_b, hold_a, hold_b, mono)
 	def get_dpm_states(self, start, end):
-		state = (ctypes.c_float * (5 * (end - start + 1)))()
+		count = end - start + 1
+		try:
+			state = self._dpm_states_buf[count]
+		except KeyError:
+			state = self._dpm_states_buf[count] = (ctypes.c_float * (5 * count))()
 		self.lib_zynmixer.getDpmStates(start, end, state)
-		result = []
-		offset = 0
-		for channel in range(start, end + 1):
-			l = []
-			for i in range(4):
-				l.append(state[offset])
-				offset +=1
-			l.append(state[offset] != 0.0)
-			offset +=1
-			result.append(l)
-		return result
+		# Convert the whole buffer in one C-level pass, then slice per channel
+		flat = state[:]
+		return [[flat[o], flat[o + 1], flat[o + 2], flat[o + 3], flat[o + 4] != 0.0] for o in range(0, 5 * count, 5)]
 
 	# Function to enable or disable digital peak meters
 	# start: First mixer channel
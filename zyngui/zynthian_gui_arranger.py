@@ -29,7 +29,6 @@ import logging
 import tkinter.font as tkfont
 from time import monotonic, sleep
 from threading import Timer
-from math import sqrt
 from collections import OrderedDict
 import os
 
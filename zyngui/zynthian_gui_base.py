@@ -112,6 +112,7 @@ class zynthian_gui_base(tkinter.Frame):
 			highlightthickness=0,
 			relief='flat',
 			bg=zynthian_gui_config.color_panel_bg)
+		self.back_button_shown = has_backbutton
 		if has_backbutton:
 			self.backbutton_canvas.grid(row=0, column=col, sticky="wn", padx=(0, self.status_lpad))
 			self.backbutton_canvas.grid_propagate(False)
@@ -208,6 +209,9 @@ class zynthian_gui_base(tkinter.Frame):
 		self.bind("<Configure>", self.on_size)
 
 	def show_back_button(self, show=True):
+		if show == self.back_button_shown:
+			return
+		self.back_button_shown = show
 		if show:
 			self.backbutton_canvas.grid(row=0, column=0, sticky="wn", padx=(0, self.status_lpad))
 			self.backbutton_canvas.grid_propagate(False)
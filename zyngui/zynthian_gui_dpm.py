@@ -48,6 +48,9 @@ class zynthian_gui_dpm():
 		self.strip = strip # Audio mixer strip
 		self.channel = channel # Audio channel 0=A, 1=B
 		self.parent = parent
+		# Direct Tcl interface, bypassing the tkinter wrappers on the per-frame refresh path
+		self._tk = parent.tk
+		self._w = parent._w
 		self.x0 = x0
 		self.y0 = y0
 		self.width = width
@@ -61,6 +64,12 @@ class zynthian_gui_dpm():
 
 		self.mono = False
 
+		# Pixels per dB, precomputed so refresh does one multiply per value
+		if vertical:
+			self.scale = height / self.lowdB
+		else:
+			self.scale = width / self.lowdB
+
 		self.hold_thickness = 1
 		self.low_color = "#00AA00"
 		self.low_hold_color = "#00FF00"
@@ -115,44 +124,47 @@ class zynthian_gui_dpm():
 	def refresh(self, dpm, hold, mono):
 		if self.strip is None:
 			return
+		# This runs once per strip per frame, so talk to Tcl directly instead of
+		# going through the tkinter coords/itemconfig wrappers
+		tk_call = self._tk.call
+		w = self._w
 		if mono != self.mono:
 			self.mono = mono
 			if mono:
-				self.parent.itemconfig(self.bg_low, fill=self.mono_color)
+				tk_call(w, 'itemconfigure', self.bg_low, '-fill', self.mono_color)
 			else:
-				self.parent.itemconfig(self.bg_low, fill=self.low_color)
-
+				tk_call(w, 'itemconfigure', self.bg_low, '-fill', self.low_color)
 
 		if self.vertical:
-			y1 = int(self.y0 + self.height * max(dpm, self.lowdB) / self.lowdB)
-			self.parent.coords(self.overlay, (self.x0, self.y0, self.x1, y1))
-			y1 = int(self.y0 + self.height * max(hold, self.lowdB) / self.lowdB)
-			self.parent.coords(self.hold, (self.x0, y1, self.x1, y1 + self.hold_thickness))
+			y1 = int(self.y0 + max(dpm, self.lowdB) * self.scale)
+			tk_call(w, 'coords', self.overlay, self.x0, self.y0, self.x1, y1)
+			y1 = int(self.y0 + max(hold, self.lowdB) * self.scale)
+			tk_call(w, 'coords', self.hold, self.x0, y1, self.x1, y1 + self.hold_thickness)
 			if y1 <= self.y_over:
-				self.parent.itemconfig(self.hold, state=NORMAL, fill="#FF0000")
+				tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', "#FF0000")
 			elif y1 <= self.y_high:
-				self.parent.itemconfig(self.hold, state=NORMAL, fill="#FFFF00")
+				tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', "#FFFF00")
 			elif y1 < self.y_low:
 				if self.mono:
-					self.parent.itemconfig(self.hold, state=NORMAL, fill="#FFFFFF")
+					tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', "#FFFFFF")
 				else:
-					self.parent.itemconfig(self.hold, state=NORMAL, fill="#00FF00")
+					tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', "#00FF00")
 			else:
-				self.parent.itemconfig(self.hold, state=HIDDEN)
+				tk_call(w, 'itemconfigure', self.hold, '-state', HIDDEN)
 
 		else:
-			x0 = int(self.width - self.width * max(dpm, self.lowdB) / self.lowdB)
-			self.parent.coords(self.overlay, (x0, self.y0, self.x1, self.y1))
-			x0 = int(self.width - self.width * max(hold, self.lowdB) / self.lowdB)
-			self.parent.coords(self.hold, (x0, self.y0, x0 + self.hold_thickness, self.y1))
+			x0 = int(self.width - max(dpm, self.lowdB) * self.scale)
+			tk_call(w, 'coords', self.overlay, x0, self.y0, self.x1, self.y1)
+			x0 = int(self.width - max(hold, self.lowdB) * self.scale)
+			tk_call(w, 'coords', self.hold, x0, self.y0, x0 + self.hold_thickness, self.y1)
 			if x0 > self.x_over:
-				self.parent.itemconfig(self.hold, state=NORMAL, fill=self.over_hold_color)
+				tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', self.over_hold_color)
 			elif x0 > self.x_high:
-				self.parent.itemconfig(self.hold, state=NORMAL, fill=self.high_hold_color)
+				tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', self.high_hold_color)
 			elif x0 > self.x_low:
 				if self.zynmixer.get_mono(self.strip):
-					self.parent.itemconfig(self.hold, state=NORMAL, fill=self.mono_hold_color)
+					tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', self.mono_hold_color)
 				else:
-					self.parent.itemconfig(self.hold, state=NORMAL, fill=self.low_hold_color)
+					tk_call(w, 'itemconfigure', self.hold, '-state', NORMAL, '-fill', self.low_hold_color)
 			else:
-				self.parent.itemconfig(self.hold, state=HIDDEN)
+				tk_call(w, 'itemconfigure', self.hold, '-state', HIDDEN)
@@ -23,8 +23,6 @@
 #
 # ******************************************************************************
 
-import logging
-
 # Zynthian specific modules
 from zyngui import zynthian_gui_config
 from zyngui.zynthian_gui_selector import zynthian_gui_selector
@@ -33,72 +31,103 @@ from zyngui.zynthian_gui_selector import zynthian_gui_selector
 # Zynthian App Selection GUI Class
 # ------------------------------------------------------------------------------
 
+# Chain-type presets for modify_chain. Copied on use because modify_chain
+# keeps its argument as modify_chain_status, which gets mutated downstream.
+_CHAIN_SYNTH = {"type": "MIDI Synth", "midi_thru": False, "audio_thru": False}
+_CHAIN_AUDIOFX = {"type": "Audio Effect", "midi_thru": False, "audio_thru": True}
+_CHAIN_MIDIFX = {"type": "MIDI Tool", "midi_thru": True, "audio_thru": False}
+_CHAIN_MIDI_AUDIOFX = {"type": "Audio Effect", "midi_thru": True, "audio_thru": True}
+_CHAIN_GENERATOR = {"type": "Audio Generator", "midi_thru": False, "audio_thru": False}
+_CHAIN_SPECIAL = {"type": "Special", "midi_thru": True, "audio_thru": True}
+
+# Section header rows (no callback), shared by all instances
+_HEADER_ADD_CHAIN = (None, 0, "> ADD CHAIN")
+_HEADER_REMOVE = (None, 0, "> REMOVE")
+_HEADER_MAIN = (None, 0, "> MAIN")
+_HEADER_SYSTEM = (None, 0, "> SYSTEM")
+
 
 class zynthian_gui_main_menu(zynthian_gui_selector):
 
 	def __init__(self):
 		super().__init__('Menu', True)
+		self._pending_action = None
+		self._pending_t = 'S'
+		# The menu is static, so build its entries once and reuse them on each fill_list
+		self._static_list_data = (
+			# Chain & Sequence Management
+			_HEADER_ADD_CHAIN,
+			(self.add_synth_chain, 0, "Add Instrument Chain"),
+			(self.add_audiofx_chain, 0, "Add Audio Chain"),
+			(self.add_midifx_chain, 0, "Add MIDI Chain"),
+			(self.add_midiaudiofx_chain, 0, "Add MIDI+Audio Chain"),
+			(self.add_generator_chain, 0, "Add Audio Generator Chain"),
+			(self.add_special_chain, 0, "Add Special Chain"),
+			_HEADER_REMOVE,
+			(self.remove_sequences, 0, "Remove Sequences"),
+			(self.remove_chains, 0, "Remove Chains"),
+			(self.remove_all, 0, "Remove All"),
+			# Apps
+			_HEADER_MAIN,
+			("snapshot", 0, "Snapshots"),
+			("zynpad", 0, "Sequencer"),
+			("audio_player", 0, "Audio Recorder"),
+			("midi_recorder", 0, "MIDI Recorder"),
+			("tempo", 0, "Tempo Settings"),
+			("alsa_mixer", 0, "Audio Levels"),
+			(self.audio_mixer_learn, 0, "Mixer Learn"),
+			# System / configuration views
+			_HEADER_SYSTEM,
+			("admin", 0, "Admin"),
+			(self.all_sounds_off, 0, "PANIC! All Sounds Off")
+		)
+		# Flat action column, so the click path needn't subscript row tuples
+		self._action_col = tuple(row[0] for row in self._static_list_data)
 
 	def fill_list(self):
-		self.list_data = []
-
-		# Chain & Sequence Management
-		self.list_data.append((None, 0, "> ADD CHAIN"))
-		self.list_data.append((self.add_synth_chain, 0, "Add Instrument Chain"))
-		self.list_data.append((self.add_audiofx_chain, 0, "Add Audio Chain"))
-		self.list_data.append((self.add_midifx_chain, 0, "Add MIDI Chain"))
-		self.list_data.append((self.add_midiaudiofx_chain, 0, "Add MIDI+Audio Chain"))
-		self.list_data.append((self.add_generator_chain, 0, "Add Audio Generator Chain"))
-		self.list_data.append((self.add_special_chain, 0, "Add Special Chain"))
-
-		self.list_data.append((None, 0, "> REMOVE"))
-		self.list_data.append((self.remove_sequences, 0, "Remove Sequences"))
-		self.list_data.append((self.remove_chains, 0, "Remove Chains"))
-		self.list_data.append((self.remove_all, 0, "Remove All"))
-
-		# Add list of Apps
-		self.list_data.append((None, 0, "> MAIN"))
-		self.list_data.append((self.snapshots, 0, "Snapshots"))
-		self.list_data.append((self.step_sequencer, 0, "Sequencer"))
-		self.list_data.append((self.audio_recorder, 0, "Audio Recorder"))
-		self.list_data.append((self.midi_recorder, 0, "MIDI Recorder"))
-		self.list_data.append((self.tempo_settings, 0, "Tempo Settings"))
-		self.list_data.append((self.audio_levels, 0, "Audio Levels"))
-		self.list_data.append((self.audio_mixer_learn, 0, "Mixer Learn"))
-
-		# Add list of System / configuration views
-		self.list_data.append((None, 0, "> SYSTEM"))
-		self.list_data.append((self.admin, 0, "Admin"))
-		self.list_data.append((self.all_sounds_off, 0, "PANIC! All Sounds Off"))
-
+		# The menu never changes, so populate the listbox only once
+		if self.list_data:
+			self.select()
+			return
+		self.list_data = list(self._static_list_data)
 		super().fill_list()
 
 	def select_action(self, i, t='S'):
-		if self.list_data[i][0]:
-			self.last_action = self.list_data[i][0]
-			self.last_action(t)
+		action = self._action_col[i]
+		if action is not None:
+			# Coalesce rapid repeated selections: return to the event loop now and
+			# dispatch only the last requested action on the next idle tick
+			self._pending_t = t
+			if self._pending_action is None:
+				zynthian_gui_config.top.after_idle(self._dispatch_pending_action)
+			self._pending_action = action
+
+	def _dispatch_pending_action(self):
+		action = self._pending_action
+		self._pending_action = None
+		if isinstance(action, str):
+			# Screen rows store the target screen name instead of a trampoline method
+			self.zyngui.show_screen(action)
+		elif action:
+			action(self._pending_t)
 
 	def add_synth_chain(self, t='S'):
-		self.zyngui.modify_chain({"type": "MIDI Synth", "midi_thru": False, "audio_thru": False})
+		self.zyngui.modify_chain(dict(_CHAIN_SYNTH))
 
 	def add_audiofx_chain(self, t='S'):
-		self.zyngui.modify_chain({"type": "Audio Effect", "midi_thru": False, "audio_thru": True})
+		self.zyngui.modify_chain(dict(_CHAIN_AUDIOFX))
 
 	def add_midifx_chain(self, t='S'):
-		self.zyngui.modify_chain({"type": "MIDI Tool", "midi_thru": True, "audio_thru": False})
+		self.zyngui.modify_chain(dict(_CHAIN_MIDIFX))
 
 	def add_midiaudiofx_chain(self, t='S'):
-		self.zyngui.modify_chain({"type": "Audio Effect", "midi_thru": True, "audio_thru": True})
+		self.zyngui.modify_chain(dict(_CHAIN_MIDI_AUDIOFX))
 
 	def add_generator_chain(self, t='S'):
-		self.zyngui.modify_chain({"type": "Audio Generator", "midi_thru": False, "audio_thru": False})
+		self.zyngui.modify_chain(dict(_CHAIN_GENERATOR))
 
 	def add_special_chain(self, t='S'):
-		self.zyngui.modify_chain({"type": "Special", "midi_thru": True, "audio_thru": True})
-
-	def snapshots(self, t='S'):
-		logging.info("Snapshots")
-		self.zyngui.show_screen("snapshot")
+		self.zyngui.modify_chain(dict(_CHAIN_SPECIAL))
 
 	def remove_all(self, t='S'):
 		self.zyngui.show_confirm("Do you really want to remove ALL chains & sequences?", self.remove_all_confirmed)
@@ -121,39 +150,16 @@ class zynthian_gui_main_menu(zynthian_gui_selector):
 		self.index = 0
 		self.zyngui.clean_sequences()
 
-	def step_sequencer(self, t='S'):
-		logging.info("Step Sequencer")
-		self.zyngui.show_screen('zynpad')
-
-	def audio_recorder(self, t='S'):
-		logging.info("Audio Recorder/Player")
-		self.zyngui.show_screen("audio_player")
-
-	def midi_recorder(self, t='S'):
-		logging.info("MIDI Recorder/Player")
-		self.zyngui.show_screen("midi_recorder")
-
 	def audio_mixer_learn(self, t='S'):
-		logging.info("Audio Mixer Learn")
 		self.zyngui.screens["audio_mixer"].midi_learn_menu()
 
-	def audio_levels(self, t='S'):
-		logging.info("Audio Levels")
-		self.zyngui.show_screen("alsa_mixer")
-
-	def tempo_settings(self, t='S'):
-		logging.info("Tempo Settings")
-		self.zyngui.show_screen("tempo")
-
-	def admin(self, t='S'):
-		logging.info("Admin")
-		self.zyngui.show_screen("admin")
-
 	def all_sounds_off(self, t='S'):
-		logging.info("All Sounds Off")
-		self.zyngui.callable_ui_action("all_sounds_off")
+		# Dispatch from the CUIA thread, like hardware-triggered panic actions
+		self.zyngui.cuia_queue.put_nowait("all_sounds_off")
 
 	def set_select_path(self):
-		self.select_path.set("Main")
+		# Avoid re-triggering the title redraw trace when the path is unchanged
+		if self.select_path.get() != "Main":
+			self.select_path.set("Main")
 
 # ------------------------------------------------------------------------------
@@ -27,6 +27,7 @@
 import os
 import tkinter
 import logging
+from tkinter import font as tkFont
 from time import monotonic
 from math import log10
 
@@ -47,9 +48,31 @@ from zyngine import zynthian_controller
 # This provides a UI element that represents a mixer strip, one used per chain
 # ------------------------------------------------------------------------------
 
+# Precomputed volume titles, avoiding log10 + float formatting on every drag event
+_DB_TITLES = tuple(f"Volume: {20 * log10((i + 1) / 1024):.2f}dB" for i in range(1024))
+
 
 class zynthian_gui_mixer_strip():
 
+	# Dirty bits for deferred redraw of individual strip controls
+	BIT_LEVEL = 1
+	BIT_SOLO = 2
+	BIT_MUTE = 4
+	BIT_BALANCE = 8
+	BIT_MONO = 16
+	BIT_REC = 32
+	BIT_PLAY = 64
+	ZCTRL_BITS = BIT_LEVEL | BIT_SOLO | BIT_MUTE | BIT_BALANCE | BIT_MONO
+	SYMBOL_BITS = {
+		'level': BIT_LEVEL,
+		'solo': BIT_SOLO,
+		'mute': BIT_MUTE,
+		'balance': BIT_BALANCE,
+		'mono': BIT_MONO,
+		'rec': BIT_REC,
+		'play': BIT_PLAY
+	}
+
 	# Initialise mixer strip object
 	#	parent: Parent object
 	#	x: Horizontal coordinate of left of fader
@@ -58,6 +81,7 @@ class zynthian_gui_mixer_strip():
 	#	height: Height of fader
 	def __init__(self, parent, x, y, width, height):
 		self.parent = parent
+		self.main_canvas = parent.main_canvas
 		self.zynmixer = parent.zynmixer
 		self.zctrls = None
 		self.x = x
@@ -67,6 +91,7 @@ class zynthian_gui_mixer_strip():
 		self.hidden = False
 		self.chain_id = None
 		self.chain = None
+		self.is_audio = False  # Cached chain.is_audio(), updated in set_chain
 
 		self.hidden = True
 
@@ -79,6 +104,10 @@ class zynthian_gui_mixer_strip():
 		self.fader_centre_x = int(x + width * 0.5)
 		self.fader_centre_y = int(y + height * 0.5)
 		self.balance_top = self.fader_bottom
+		self.balance_bottom = self.balance_top + self.balance_height
+		self.balance_half_width = int(self.width // 2)
+		self.balance_x0 = int(x)
+		self.balance_x1 = int(x + self.width)
 		self.balance_control_centre = int(self.width / 2)
 		self.balance_control_width = int(self.width / 4) # Width of each half of balance control
 
@@ -95,6 +124,34 @@ class zynthian_gui_mixer_strip():
 		self.strip_drag_start = None
 		self.dragging = False
 
+		# Last pushed canvas state, used to skip redundant Tcl calls
+		self._last_item_config = {}
+		self._last_item_coords = {}
+		self._audio_items_shown = True
+		self._last_fader_top = None
+		self._last_balance = None
+		self._last_balance_ml = False
+		self._last_solo = None
+		self._last_solo_ml = False
+		self._last_mute = None
+		self._last_mute_ml = False
+		self._last_fader_desc = None
+		self._last_title = None
+		self._last_title_ts = 0.0
+		self._last_dpm_q = None
+
+		# Control drawers dispatched by dirty bit in draw_dirty
+		self._bit_drawers = {
+			self.BIT_LEVEL: self.draw_level,
+			self.BIT_SOLO: self.draw_solo,
+			self.BIT_MUTE: self.draw_mute,
+			self.BIT_BALANCE: self.draw_balance,
+			self.BIT_MONO: self.draw_mono,
+			self.BIT_REC: self.draw_rec,
+			self.BIT_PLAY: self.draw_play
+		}
+		self.dirty_mask = 0
+
 		# Default style
 		#self.fader_bg_color = zynthian_gui_config.color_bg
 		self.fader_bg_color = zynthian_gui_config.color_panel_bg
@@ -121,12 +178,39 @@ class zynthian_gui_mixer_strip():
 
 		#font_size = int(0.5 * self.legend_height)
 		font_size = int(0.25 * self.width)
-		self.font = (zynthian_gui_config.font_family, font_size)
-		self.font_fader = (zynthian_gui_config.font_family, int(0.9 * font_size))
-		self.font_icons = ("forkawesome", int(0.3 * self.width))
-		self.font_learn = (zynthian_gui_config.font_family, int(0.7 * font_size))
+		# Named font objects: Tk caches their metrics, so itemconfig(font=...)
+		# skips the descriptor reparse that tuple fonts pay on every call
+		self.font = tkFont.Font(family=zynthian_gui_config.font_family, size=font_size)
+		self.font_fader = tkFont.Font(family=zynthian_gui_config.font_family, size=int(0.9 * font_size))
+		self.font_icons = tkFont.Font(family="forkawesome", size=int(0.3 * self.width))
+		self.font_learn = tkFont.Font(family=zynthian_gui_config.font_family, size=int(0.7 * font_size))
 
 		self.fader_text_limit = self.fader_top + int(0.1 * self.fader_height)
+		self.fader_text_max_px = self.fader_bottom - 2 - self.fader_text_limit
+
+		# Style tables for the solo/mute drawers, keyed by (learn is this
+		# control, learn mode active, control value) => (bg, text color, font,
+		# text). A text of None means compose the learned-CC text at draw time.
+		self._solo_style = {}
+		self._mute_style = {}
+		for val in (False, True):
+			bg = self.solo_color if val else self.button_bgcol
+			bg_ml = self.learn_color_hl if val else self.learn_color
+			self._solo_style[(True, True, val)] = (bg_ml, zynthian_gui_config.color_ml, self.font, "S")
+			self._solo_style[(False, True, val)] = (bg_ml, zynthian_gui_config.color_hl, self.font_learn, None)
+			self._solo_style[(False, False, val)] = (bg, self.button_txcol, self.font, "S")
+			icon = "\uf32f" if val else "\uf028"
+			bg = self.mute_color if val else self.button_bgcol
+			self._mute_style[(True, True, val)] = (bg_ml, zynthian_gui_config.color_ml, self.font_icons, icon)
+			self._mute_style[(False, True, val)] = (bg_ml, zynthian_gui_config.color_hl, self.font_learn, None)
+			self._mute_style[(False, False, val)] = (bg, self.button_txcol, self.font_icons, icon)
+		# Balance styles keyed by (learn is this control, learn mode active)
+		# => (left color, right color, text color, text state, text)
+		self._balance_style = {
+			(True, True): (self.learn_color_hl, self.learn_color, zynthian_gui_config.color_ml, tkinter.NORMAL, "??"),
+			(False, True): (self.learn_color_hl, self.learn_color, zynthian_gui_config.color_hl, tkinter.NORMAL, None),
+			(False, False): (self.left_color, self.right_color, self.button_txcol, tkinter.HIDDEN, "")
+		}
 
 		'''
 		Create GUI elements
@@ -137,80 +221,141 @@ class zynthian_gui_mixer_strip():
 		'''
 
 		# Fader
-		self.fader_bg = self.parent.main_canvas.create_rectangle(x, self.fader_top, x + self.width, self.fader_bottom, fill=self.fader_bg_color, width=0)
-		self.parent.main_canvas.itemconfig(self.fader_bg, tags=(f"fader:{self.fader_bg}", f"strip:{self.fader_bg}"))
-		self.fader = self.parent.main_canvas.create_rectangle(x, self.fader_top, x + self.width, self.fader_bottom, fill=self.fader_color, width=0, tags=(f"fader:{self.fader_bg}", f"strip:{self.fader_bg}", f"audio_strip:{self.fader_bg}"))
-		self.fader_text = self.parent.main_canvas.create_text(x, self.fader_bottom - 2, fill=self.legend_txt_color, text="", tags=(f"fader:{self.fader_bg}", f"strip:{self.fader_bg}"), angle=90, anchor="nw", font=self.font_fader)
+		self.fader_bg = self.main_canvas.create_rectangle(x, self.fader_top, x + self.width, self.fader_bottom, fill=self.fader_bg_color, width=0)
+		# Canvas tags, interpolated once and reused everywhere
+		self.tag_fader = f"fader:{self.fader_bg}"
+		self.tag_strip = f"strip:{self.fader_bg}"
+		self.tag_audio_strip = f"audio_strip:{self.fader_bg}"
+		self.tag_solo = f"solo:{self.fader_bg}"
+		self.tag_mute = f"mute:{self.fader_bg}"
+		self.tag_legend = f"legend:{self.fader_bg}"
+		self.tag_balance = f"balance:{self.fader_bg}"
+		self.main_canvas.itemconfig(self.fader_bg, tags=(self.tag_fader, self.tag_strip))
+		self.fader = self.main_canvas.create_rectangle(x, self.fader_top, x + self.width, self.fader_bottom, fill=self.fader_color, width=0, tags=(self.tag_fader, self.tag_strip, self.tag_audio_strip))
+		self.fader_text = self.main_canvas.create_text(x, self.fader_bottom - 2, fill=self.legend_txt_color, text="", tags=(self.tag_fader, self.tag_strip), angle=90, anchor="nw", font=self.font_fader)
+
+		# Legend strip at bottom of screen
+		self.legend_strip_bg = self.main_canvas.create_rectangle(x, self.height - self.legend_height, x + self.width, self.height, width=0, tags=(self.tag_strip,self.tag_legend), fill=self.legend_bg_color)
+		self.legend_strip_txt = self.main_canvas.create_text(self.fader_centre_x, self.height - self.legend_height / 2, fill=self.legend_txt_color, text="-", tags=(self.tag_strip,self.tag_legend), font=self.font)
+
+		# Audio-only items (DPMs, solo/mute buttons, balance, rec/play indicators)
+		# are created lazily on first bind to an audio chain, keeping the canvas
+		# item count low for MIDI-only strips
+		self._audio_items_built = False
+		self.dpm_a = None
+		self.dpm_b = None
+
+		self.parent.zyngui.multitouch.tag_bind(self.main_canvas, self.tag_fader, "press", self.on_fader_press)
+		self.parent.zyngui.multitouch.tag_bind(self.main_canvas, self.tag_fader, "motion", self.on_fader_motion)
+
+		# Register mouse handlers with the parent's canvas-level dispatcher
+		fader_handlers = {
+			'press': self.on_fader_press,
+			'release': self.on_fader_release,
+			'b1motion': self.on_fader_motion,
+			'wheelup': self.on_fader_wheel_up,
+			'wheeldown': self.on_fader_wheel_down
+		}
+		legend_handlers = {
+			'press': self.on_strip_press,
+			'release': self.on_strip_release,
+			'motion': self.on_strip_motion,
+			'b1motion': self.on_strip_motion,
+			'wheelup': self.parent.on_wheel,
+			'wheeldown': self.parent.on_wheel
+		}
+		for item in (self.fader_bg, self.fader, self.fader_text):
+			self.parent.item_handlers[item] = fader_handlers
+		for item in (self.legend_strip_bg, self.legend_strip_txt):
+			self.parent.item_handlers[item] = legend_handlers
+
+		self.draw_control()
+
+	# Function to create the audio-only canvas items, deferred until the strip
+	# is first bound to an audio chain
+	def _build_audio_items(self):
+		x = self.x
 
 		# DPM
-		self.dpm_a = zynthian_gui_dpm(self.zynmixer, None, 0, self.parent.main_canvas, self.dpm_a_x0, self.dpm_y0, self.dpm_width, self.fader_height, True, (f"strip:{self.fader_bg}",f"audio_strip:{self.fader_bg}"))
-		self.dpm_b = zynthian_gui_dpm(self.zynmixer, None, 1, self.parent.main_canvas, self.dpm_b_x0, self.dpm_y0, self.dpm_width, self.fader_height, True, (f"strip:{self.fader_bg}",f"audio_strip:{self.fader_bg}"))
+		self.dpm_a = zynthian_gui_dpm(self.zynmixer, None, 0, self.main_canvas, self.dpm_a_x0, self.dpm_y0, self.dpm_width, self.fader_height, True, (self.tag_strip,self.tag_audio_strip))
+		self.dpm_b = zynthian_gui_dpm(self.zynmixer, None, 1, self.main_canvas, self.dpm_b_x0, self.dpm_y0, self.dpm_width, self.fader_height, True, (self.tag_strip,self.tag_audio_strip))
+
+		self.mono_text = self.main_canvas.create_text(int(self.dpm_b_x0 + self.dpm_width / 2), int(self.fader_top + self.fader_height / 2), text="??", state=tkinter.HIDDEN)
 
-		self.mono_text = self.parent.main_canvas.create_text(int(self.dpm_b_x0 + self.dpm_width / 2), int(self.fader_top + self.fader_height / 2), text="??", state=tkinter.HIDDEN)
-		
 		# Solo button
-		self.solo = self.parent.main_canvas.create_rectangle(x, 0, x + self.width, self.button_height, fill=self.button_bgcol, width=0, tags=(f"solo_button:{self.fader_bg}", f"strip:{self.fader_bg}", f"audio_strip:{self.fader_bg}"))
-		self.solo_text = self.parent.main_canvas.create_text(x + self.width / 2, self.button_height * 0.5, text="S", fill=self.button_txcol, tags=(f"solo_button:{self.fader_bg}", f"strip:{self.fader_bg}", f"audio_strip:{self.fader_bg}"), font=self.font)
+		self.solo = self.main_canvas.create_rectangle(x, 0, x + self.width, self.button_height, fill=self.button_bgcol, width=0, tags=(self.tag_solo, self.tag_strip, self.tag_audio_strip))
+		self.solo_text = self.main_canvas.create_text(x + self.width / 2, self.button_height * 0.5, text="S", fill=self.button_txcol, tags=(self.tag_solo, self.tag_strip, self.tag_audio_strip), font=self.font)
 
 		# Mute button
-		self.mute = self.parent.main_canvas.create_rectangle(x, self.button_height, x + self.width, self.button_height * 2, fill=self.button_bgcol, width=0, tags=(f"mute:{self.fader_bg}", f"strip:{self.fader_bg}", f"audio_strip:{self.fader_bg}"))
-		self.mute_text = self.parent.main_canvas.create_text(x + self.width / 2, self.button_height * 1.5, text="M", fill=self.button_txcol, tags=(f"mute:{self.fader_bg}", f"strip:{self.fader_bg}", f"audio_strip:{self.fader_bg}"), font=self.font)
-
-		# Legend strip at bottom of screen
-		self.legend_strip_bg = self.parent.main_canvas.create_rectangle(x, self.height - self.legend_height, x + self.width, self.height, width=0, tags=(f"strip:{self.fader_bg}",f"legend_strip:{self.fader_bg}"), fill=self.legend_bg_color)
-		self.legend_strip_txt = self.parent.main_canvas.create_text(self.fader_centre_x, self.height - self.legend_height / 2, fill=self.legend_txt_color, text="-", tags=(f"strip:{self.fader_bg}",f"legend_strip:{self.fader_bg}"), font=self.font)
+		self.mute = self.main_canvas.create_rectangle(x, self.button_height, x + self.width, self.button_height * 2, fill=self.button_bgcol, width=0, tags=(self.tag_mute, self.tag_strip, self.tag_audio_strip))
+		self.mute_text = self.main_canvas.create_text(x + self.width / 2, self.button_height * 1.5, text="M", fill=self.button_txcol, tags=(self.tag_mute, self.tag_strip, self.tag_audio_strip), font=self.font)
 
 		# Balance indicator
-		self.balance_left = self.parent.main_canvas.create_rectangle(x, self.balance_top, self.fader_centre_x, self.balance_top + self.balance_height, fill=self.left_color, width=0, tags=(f"strip:{self.fader_bg}", f"balance:{self.fader_bg}", f"audio_strip:{self.fader_bg}"))
-		self.balance_right = self.parent.main_canvas.create_rectangle(self.fader_centre_x + 1, self.balance_top, self.width, self.balance_top + self.balance_height , fill=self.right_color, width=0, tags=(f"strip:{self.fader_bg}", f"balance:{self.fader_bg}", f"audio_strip:{self.fader_bg}"))
-		self.balance_text = self.parent.main_canvas.create_text(self.fader_centre_x, int(self.balance_top + self.balance_height / 2) - 1, text="??", font=self.font_learn, state=tkinter.HIDDEN)
-		self.parent.main_canvas.tag_bind(f"balance:{self.fader_bg}", "<ButtonPress-1>", self.on_balance_press)
+		self.balance_left = self.main_canvas.create_rectangle(x, self.balance_top, self.fader_centre_x, self.balance_top + self.balance_height, fill=self.left_color, width=0, tags=(self.tag_strip, self.tag_balance, self.tag_audio_strip))
+		self.balance_right = self.main_canvas.create_rectangle(self.fader_centre_x + 1, self.balance_top, self.width, self.balance_top + self.balance_height , fill=self.right_color, width=0, tags=(self.tag_strip, self.tag_balance, self.tag_audio_strip))
+		self.balance_text = self.main_canvas.create_text(self.fader_centre_x, int(self.balance_top + self.balance_height / 2) - 1, text="??", font=self.font_learn, state=tkinter.HIDDEN)
 
 		# Fader indicators
-		self.record_indicator = self.parent.main_canvas.create_text(x + 2, self.height - 16, text="⚫", fill="#009000", anchor="sw", tags=(f"strip:{self.fader_bg}"), state=tkinter.HIDDEN)
-		self.play_indicator = self.parent.main_canvas.create_text(x + 2, self.height - 2, text="⏹", fill="#009000", anchor="sw", tags=(f"strip:{self.fader_bg}"), state=tkinter.HIDDEN)
-
-		self.parent.zyngui.multitouch.tag_bind(self.parent.main_canvas, "fader:%s"%(self.fader_bg), "press", self.on_fader_press)
-		self.parent.zyngui.multitouch.tag_bind(self.parent.main_canvas, "fader:%s"%(self.fader_bg), "motion", self.on_fader_motion)
-		self.parent.main_canvas.tag_bind(f"fader:{self.fader_bg}", "<ButtonPress-1>", self.on_fader_press)
-		self.parent.main_canvas.tag_bind(f"fader:{self.fader_bg}", "<ButtonRelease-1>", self.on_fader_release)
-		self.parent.main_canvas.tag_bind(f"fader:{self.fader_bg}", "<B1-Motion>", self.on_fader_motion)
-		if zynthian_gui_config.force_enable_cursor:
-			self.parent.main_canvas.tag_bind(f"fader:{self.fader_bg}", "<Button-4>", self.on_fader_wheel_up)
-			self.parent.main_canvas.tag_bind(f"fader:{self.fader_bg}", "<Button-5>", self.on_fader_wheel_down)
-			self.parent.main_canvas.tag_bind(f"balance:{self.fader_bg}", "<Button-4>", self.on_balance_wheel_up)
-			self.parent.main_canvas.tag_bind(f"balance:{self.fader_bg}", "<Button-5>", self.on_balance_wheel_down)
-			self.parent.main_canvas.tag_bind(f"legend_strip:{self.fader_bg}", "<Button-4>", self.parent.on_wheel)
-			self.parent.main_canvas.tag_bind(f"legend_strip:{self.fader_bg}", "<Button-5>", self.parent.on_wheel)
-		self.parent.main_canvas.tag_bind(f"mute:{self.fader_bg}", "<ButtonRelease-1>", self.on_mute_release)
-		self.parent.main_canvas.tag_bind(f"solo_button:{self.fader_bg}", "<ButtonRelease-1>", self.on_solo_release)
-		self.parent.main_canvas.tag_bind(f"legend_strip:{self.fader_bg}", "<ButtonPress-1>", self.on_strip_press)
-		self.parent.main_canvas.tag_bind(f"legend_strip:{self.fader_bg}", "<ButtonRelease-1>", self.on_strip_release)
-		self.parent.main_canvas.tag_bind(f"legend_strip:{self.fader_bg}", "<Motion>", self.on_strip_motion)
-
-		self.draw_control()
+		self.record_indicator = self.main_canvas.create_text(x + 2, self.height - 16, text="⚫", fill="#009000", anchor="sw", tags=(self.tag_strip), state=tkinter.HIDDEN)
+		self.play_indicator = self.main_canvas.create_text(x + 2, self.height - 2, text="⏹", fill="#009000", anchor="sw", tags=(self.tag_strip), state=tkinter.HIDDEN)
+
+		balance_handlers = {
+			'press': self.on_balance_press,
+			'wheelup': self.on_balance_wheel_up,
+			'wheeldown': self.on_balance_wheel_down
+		}
+		solo_handlers = {'release': self.on_solo_release}
+		mute_handlers = {'release': self.on_mute_release}
+		for item in (self.balance_left, self.balance_right):
+			self.parent.item_handlers[item] = balance_handlers
+		for item in (self.solo, self.solo_text):
+			self.parent.item_handlers[item] = solo_handlers
+		for item in (self.mute, self.mute_text):
+			self.parent.item_handlers[item] = mute_handlers
+
+		# Items are created visible, so match the current strip state
+		if self.hidden:
+			self.main_canvas.itemconfig(self.tag_audio_strip, state=tkinter.HIDDEN)
+		self._audio_items_shown = not self.hidden
+		self._audio_items_built = True
+
+	# Function to update a canvas item config, skipping the Tcl call if unchanged
+	def _itemconfig(self, item, **kwargs):
+		if self._last_item_config.get(item) != kwargs:
+			self._last_item_config[item] = kwargs
+			self.main_canvas.itemconfig(item, **kwargs)
+
+	# Function to update canvas item coords, skipping the Tcl call if unchanged
+	def _coords(self, item, *coords):
+		if self._last_item_coords.get(item) != coords:
+			self._last_item_coords[item] = coords
+			self.main_canvas.coords(item, *coords)
 
 	# Function to hide mixer strip
 	def hide(self):
-		self.parent.main_canvas.itemconfig(f"strip:{self.fader_bg}", state=tkinter.HIDDEN)
-		self.hidden = True
+		if not self.hidden:
+			self.main_canvas.itemconfig(self.tag_strip, state=tkinter.HIDDEN)
+			self.hidden = True
 
 	# Function to show mixer strip
 	def show(self):
-		self.dpm_a.set_strip(self.chain.mixer_chan)
-		self.dpm_b.set_strip(self.chain.mixer_chan)
-		self.parent.main_canvas.itemconfig(f"strip:{self.fader_bg}", state=tkinter.NORMAL)
-		try:
-			if not self.chain.is_audio():
-				self.parent.main_canvas.itemconfig(f"audio_strip:{self.fader_bg}", state=tkinter.HIDDEN)
-		except:
-			pass
-		self.hidden = False
+		if self.dpm_a:
+			self.dpm_a.set_strip(self.chain.mixer_chan)
+			self.dpm_b.set_strip(self.chain.mixer_chan)
+			self._last_dpm_q = None
+		if self.hidden:
+			# The whole-strip tag covers the audio items, so they show too
+			self.main_canvas.itemconfig(self.tag_strip, state=tkinter.NORMAL)
+			self._audio_items_shown = True
+			self.hidden = False
+		if self.is_audio != self._audio_items_shown:
+			self.main_canvas.itemconfig(self.tag_audio_strip, state=tkinter.NORMAL if self.is_audio else tkinter.HIDDEN)
+			self._audio_items_shown = self.is_audio
 		self.draw_control()
 
 
 	def get_ctrl_learn_text(self, ctrl):
-		if not self.chain.is_audio():
+		if not self.is_audio:
 			return ""
 		try:
 			param = self.zynmixer.get_learned_cc(self.zctrls[ctrl])
@@ -221,8 +366,15 @@ class zynthian_gui_mixer_strip():
 	# Function to draw the DPM level meter for a mixer strip
 	# state = [dpm_a, dpm_b, hold_a, hold_b, mono]
 	def draw_dpm(self, state):
-		if self.hidden or self.chain.mixer_chan is None:
+		if self.hidden or self.dpm_a is None or self.chain.mixer_chan is None:
+			return
+		# Quantize to meter pixel resolution and skip the canvas work when
+		# nothing would visibly move
+		scale = self.dpm_a.scale
+		q = (int(state[0] * scale), int(state[1] * scale), int(state[2] * scale), int(state[3] * scale), state[4])
+		if q == self._last_dpm_q:
 			return
+		self._last_dpm_q = q
 
 		self.dpm_a.refresh(state[0], state[2], state[4])
 		self.dpm_b.refresh(state[1], state[3], state[4])
@@ -231,212 +383,207 @@ class zynthian_gui_mixer_strip():
 		balance = self.zynmixer.get_balance(self.chain.mixer_chan)
 		if balance is None:
 			return
+		# Steady state: skip everything unless the value or MIDI-learn mode changed
+		ml_zctrl = self.parent.zynmixer.midi_learn_zctrl
+		if balance == self._last_balance and not ml_zctrl and not self._last_balance_ml:
+			return
+		self._last_balance = balance
+		self._last_balance_ml = bool(ml_zctrl)
+		x_mid = self.balance_x0 + self.balance_half_width
 		if balance > 0:
-			self.parent.main_canvas.coords(self.balance_left,
-				self.x + balance * self.width / 2, self.balance_top,
-				self.x + self.width / 2, self.balance_top + self.balance_height)
-			self.parent.main_canvas.coords(self.balance_right,
-				self.x + self.width / 2, self.balance_top,
-				self.x + self.width, self.balance_top + self.balance_height)
+			self._coords(self.balance_left,
+				self.balance_x0 + int(balance * self.balance_half_width), self.balance_top,
+				x_mid, self.balance_bottom)
+			self._coords(self.balance_right,
+				x_mid, self.balance_top,
+				self.balance_x1, self.balance_bottom)
 		else:
-			self.parent.main_canvas.coords(self.balance_left,
-				self.x, self.balance_top,
-				self.x + self.width / 2, self.balance_top + self. balance_height)
-			self.parent.main_canvas.coords(self.balance_right,
-				self.x + self.width / 2, self.balance_top,
-				self.x + self.width * balance / 2 + self.width, self.balance_top + self.balance_height)
-
-		if self.parent.zynmixer.midi_learn_zctrl == self.zctrls["balance"]:
-			lcolor = self.learn_color_hl
-			rcolor = self.learn_color
-			txcolor = zynthian_gui_config.color_ml
-			txstate = tkinter.NORMAL
-			text = "??"
-		elif self.parent.zynmixer.midi_learn_zctrl:
-			lcolor = self.learn_color_hl
-			rcolor = self.learn_color
-			txcolor = zynthian_gui_config.color_hl
-			txstate = tkinter.NORMAL
+			self._coords(self.balance_left,
+				self.balance_x0, self.balance_top,
+				x_mid, self.balance_bottom)
+			self._coords(self.balance_right,
+				x_mid, self.balance_top,
+				self.balance_x1 + int(balance * self.balance_half_width), self.balance_bottom)
+
+		lcolor, rcolor, txcolor, txstate, text = self._balance_style[(ml_zctrl == self.zctrls["balance"], bool(ml_zctrl))]
+		if text is None:
 			text = f"{self.get_ctrl_learn_text('balance')}"
-		else:
-			lcolor = self.left_color
-			rcolor = self.right_color
-			txcolor = self.button_txcol
-			txstate = tkinter.HIDDEN
-			text = ""
 
-		self.parent.main_canvas.itemconfig(self.balance_left, fill=lcolor)
-		self.parent.main_canvas.itemconfig(self.balance_right, fill=rcolor)
-		self.parent.main_canvas.itemconfig(self.balance_text, state=txstate, text=text, fill=txcolor)
+		self._itemconfig(self.balance_left, fill=lcolor)
+		self._itemconfig(self.balance_right, fill=rcolor)
+		self._itemconfig(self.balance_text, state=txstate, text=text, fill=txcolor)
 
 	def draw_level(self):
 		level = self.zynmixer.get_level(self.chain.mixer_chan)
-		if level is not None:
-			self.parent.main_canvas.coords(self.fader, self.x, self.fader_top + self.fader_height * (1 - level), self.x + self.fader_width, self.fader_bottom)
+		if level is None:
+			return
+		# Only the top edge moves, so quantize it to a pixel and skip the
+		# canvas call when it hasn't moved since the last refresh
+		fader_top = int(self.fader_top + self.fader_height * (1 - level))
+		if fader_top != self._last_fader_top:
+			self._last_fader_top = fader_top
+			self.main_canvas.coords(self.fader, self.x, fader_top, self.x + self.fader_width, self.fader_bottom)
 
 	def draw_fader(self):
-		if self.zctrls and self.parent.zynmixer.midi_learn_zctrl == self.zctrls["level"]:
-			self.parent.main_canvas.coords(self.fader_text, self.fader_centre_x, self.fader_centre_y - 2)
-			self.parent.main_canvas.itemconfig(self.fader_text, text="??", font=self.font_learn, angle=0, fill=zynthian_gui_config.color_ml, justify=tkinter.CENTER, anchor=tkinter.CENTER)
-		elif self.parent.zynmixer.midi_learn_zctrl:
+		ml_zctrl = self.parent.zynmixer.midi_learn_zctrl
+		if ml_zctrl:
+			# Invalidate the label cache so the next normal draw repaints it
+			self._last_fader_desc = None
+		self._last_title = None
+		self._last_title_ts = 0.0
+		if self.zctrls and ml_zctrl == self.zctrls["level"]:
+			self._coords(self.fader_text, self.fader_centre_x, self.fader_centre_y - 2)
+			self._itemconfig(self.fader_text, text="??", font=self.font_learn, angle=0, fill=zynthian_gui_config.color_ml, justify=tkinter.CENTER, anchor=tkinter.CENTER)
+		elif ml_zctrl:
 			text = self.get_ctrl_learn_text('level')
-			self.parent.main_canvas.coords(self.fader_text, self.fader_centre_x, self.fader_centre_y - 2)
-			self.parent.main_canvas.itemconfig(self.fader_text, text=text, font=self.font_learn, angle=0, fill=zynthian_gui_config.color_hl, justify=tkinter.CENTER, anchor=tkinter.CENTER)
+			self._coords(self.fader_text, self.fader_centre_x, self.fader_centre_y - 2)
+			self._itemconfig(self.fader_text, text=text, font=self.font_learn, angle=0, fill=zynthian_gui_config.color_hl, justify=tkinter.CENTER, anchor=tkinter.CENTER)
 		else:
 			if self.chain is not None:
-				label_parts = self.chain.get_description(2).split("\n") + [""] #TODO
+				desc = self.chain.get_description(2)
+				label_parts = desc.split("\n") + [""] #TODO
 			else:
+				desc = None
 				label_parts = ["No info"]
+			if desc == self._last_fader_desc:
+				return
+			self._last_fader_desc = desc
 
+			# Truncate labels with font metrics instead of itemconfig+bbox round-trips
+			measure = self.font_fader.measure
 			for i, label in enumerate(label_parts):
-				#self.parent.main_canvas.itemconfig(self.fader_text, text=label, state=tkinter.NORMAL)
-				bounds = self.parent.main_canvas.bbox(self.fader_text)
-				if bounds[1] < self.fader_text_limit:
-					while bounds and bounds[1] < self.fader_text_limit:
+				if measure(label) > self.fader_text_max_px:
+					while label and measure(label) > self.fader_text_max_px:
 						label = label[:-1]
-						self.parent.main_canvas.itemconfig(self.fader_text, text=label)
-						bounds = self.parent.main_canvas.bbox(self.fader_text)
 					label_parts[i] = label + "..."
-			self.parent.main_canvas.itemconfig(self.fader_text, text="\n".join(label_parts), font=self.font_fader, angle=90, fill=self.legend_txt_color, justify=tkinter.LEFT, anchor=tkinter.NW)
-			self.parent.main_canvas.coords(self.fader_text, self.x, self.fader_bottom - 2)
+			self._itemconfig(self.fader_text, text="\n".join(label_parts), font=self.font_fader, angle=90, fill=self.legend_txt_color, justify=tkinter.LEFT, anchor=tkinter.NW)
+			self._coords(self.fader_text, self.x, self.fader_bottom - 2)
 
 	def draw_solo(self):
-		txcolor = self.button_txcol
-		font = self.font
-		text = "S"
-		if self.zynmixer.get_solo(self.chain.mixer_chan):
-			if self.parent.zynmixer.midi_learn_zctrl:
-				bgcolor = self.learn_color_hl
-			else:
-				bgcolor = self.solo_color
-		else:
-			if self.parent.zynmixer.midi_learn_zctrl:
-				bgcolor = self.learn_color
-			else:
-				bgcolor = self.button_bgcol
-
-		if self.parent.zynmixer.midi_learn_zctrl == self.zctrls["solo"]:
-			txcolor = zynthian_gui_config.color_ml
-		elif self.parent.zynmixer.midi_learn_zctrl:
-			txcolor = zynthian_gui_config.color_hl
-			font = self.font_learn
+		solo = self.zynmixer.get_solo(self.chain.mixer_chan)
+		ml_zctrl = self.parent.zynmixer.midi_learn_zctrl
+		if solo == self._last_solo and not ml_zctrl and not self._last_solo_ml:
+			return
+		self._last_solo = solo
+		self._last_solo_ml = bool(ml_zctrl)
+		bgcolor, txcolor, font, text = self._solo_style[(ml_zctrl == self.zctrls["solo"], bool(ml_zctrl), bool(solo))]
+		if text is None:
 			text = f"S {self.get_ctrl_learn_text('solo')}"
 
-		self.parent.main_canvas.itemconfig(self.solo, fill=bgcolor)
-		self.parent.main_canvas.itemconfig(self.solo_text, text=text, font=font, fill=txcolor)
+		self._itemconfig(self.solo, fill=bgcolor)
+		self._itemconfig(self.solo_text, text=text, font=font, fill=txcolor)
 
 	def draw_mute(self):
-		txcolor = self.button_txcol
-		font = self.font_icons
-		if self.zynmixer.get_mute(self.chain.mixer_chan):
-			if self.parent.zynmixer.midi_learn_zctrl:
-				bgcolor = self.learn_color_hl
-			else:
-				bgcolor = self.mute_color
-			text = "\uf32f"
-		else:
-			if self.parent.zynmixer.midi_learn_zctrl:
-				bgcolor = self.learn_color
-			else:
-				bgcolor = self.button_bgcol
-			text = "\uf028"
-
-		if self.parent.zynmixer.midi_learn_zctrl == self.zctrls["mute"]:
-			txcolor = zynthian_gui_config.color_ml
-		elif self.parent.zynmixer.midi_learn_zctrl:
-			txcolor = zynthian_gui_config.color_hl
-			font = self.font_learn
+		mute = self.zynmixer.get_mute(self.chain.mixer_chan)
+		ml_zctrl = self.parent.zynmixer.midi_learn_zctrl
+		if mute == self._last_mute and not ml_zctrl and not self._last_mute_ml:
+			return
+		self._last_mute = mute
+		self._last_mute_ml = bool(ml_zctrl)
+		bgcolor, txcolor, font, text = self._mute_style[(ml_zctrl == self.zctrls["mute"], bool(ml_zctrl), bool(mute))]
+		if text is None:
 			text = f"\uf32f {self.get_ctrl_learn_text('mute')}"
 
-		self.parent.main_canvas.itemconfig(self.mute, fill=bgcolor)
-		self.parent.main_canvas.itemconfig(self.mute_text, text=text, font=font, fill=txcolor)
+		self._itemconfig(self.mute, fill=bgcolor)
+		self._itemconfig(self.mute_text, text=text, font=font, fill=txcolor)
 
 	def draw_mono(self):
 		"""
 		if self.zynmixer.get_mono(self.chain.mixer_chan):
-			self.parent.main_canvas.itemconfig(self.dpm_l_a, fill=self.mono_color)
-			self.parent.main_canvas.itemconfig(self.dpm_l_b, fill=self.mono_color)
+			self.main_canvas.itemconfig(self.dpm_l_a, fill=self.mono_color)
+			self.main_canvas.itemconfig(self.dpm_l_b, fill=self.mono_color)
 			self.dpm_hold_color = "#FFFFFF"
 		else:
-			self.parent.main_canvas.itemconfig(self.dpm_l_a, fill=self.low_color)
-			self.parent.main_canvas.itemconfig(self.dpm_l_b, fill=self.low_color)
+			self.main_canvas.itemconfig(self.dpm_l_a, fill=self.low_color)
+			self.main_canvas.itemconfig(self.dpm_l_b, fill=self.low_color)
 			self.dpm_hold_color = "#00FF00"
 		"""
 
-	# Function to draw a mixer strip UI control
-	# control: Name of control or None to redraw all controls in the strip
-	def draw_control(self, control=None):
-		if self.hidden or self.chain is None: # or self.zctrls is None:
-			return
-
-		if control == None:
-			if self.chain_id == 0:
-				self.parent.main_canvas.itemconfig(self.legend_strip_txt, text="Main", font=self.font)
+	def draw_rec(self):
+		if self.is_audio and self.parent.state_manager.audio_recorder.is_armed(self.chain.mixer_chan):
+			if self.parent.state_manager.audio_recorder.status:
+				self._itemconfig(self.record_indicator, fill=self.rec_color, state=tkinter.NORMAL)
 			else:
-				font = self.font
-				if self.parent.moving_chain and self.chain_id == self.parent.zyngui.chain_manager.active_chain_id:
-					strip_txt = f"⇦⇨"
-				elif isinstance(self.chain.midi_chan, int):
-					if 0 <= self.chain.midi_chan < 16:
-						strip_txt = f"♫ {self.chain.midi_chan + 1}"
-					elif self.chain.midi_chan == 0xffff:
-						strip_txt = f"♫ All"
-					else:
-						strip_txt = f"♫ Err"
-				elif self.chain.is_audio:
-					strip_txt = "\uf130"
-					font = self.font_icons
-				else:
-					strip_txt = "\uf0ae"
-					font = self.font_icons
-					#procs = self.chain.get_processor_count() - 1
-				self.parent.main_canvas.itemconfig(self.legend_strip_txt, text=strip_txt, font=font)
-			self.draw_fader()
-		try:
-			if not self.chain.is_audio():
-				self.parent.main_canvas.itemconfig(self.record_indicator, state=tkinter.HIDDEN)
-				self.parent.main_canvas.itemconfig(self.play_indicator, state=tkinter.HIDDEN)
-				return
-		except Exception as e:
-			logging.error(e)
-
-		if self.zctrls:
-			if control in [None, 'level']:
-				self.draw_level()
-
-			if control in [None, 'solo']:
-				self.draw_solo()
-
-			if control in [None, 'mute']:
-				self.draw_mute()
-
-			if control in [None, 'balance']:
-				self.draw_balance()
-
-			if control in [None, 'mono']:
-				self.draw_mono()
+				self._itemconfig(self.record_indicator, fill=self.high_color, state=tkinter.NORMAL)
+		else:
+			self._itemconfig(self.record_indicator, state=tkinter.HIDDEN)
 
-		if control in [None, 'rec']:
-			if self.chain.is_audio() and self.parent.zyngui.state_manager.audio_recorder.is_armed(self.chain.mixer_chan):
-				if self.parent.zyngui.state_manager.audio_recorder.status:
-					self.parent.main_canvas.itemconfig(self.record_indicator, fill=self.rec_color, state=tkinter.NORMAL)
+	def draw_play(self):
+		try:
+			processor = self.chain.synth_slots[0][0]
+			if processor.eng_code == "AP":
+				if zynaudioplayer.get_playback_state(processor.handle):
+					self._itemconfig(self.play_indicator, text="▶", fill="#009000", state=tkinter.NORMAL)
 				else:
-					self.parent.main_canvas.itemconfig(self.record_indicator, fill=self.high_color, state=tkinter.NORMAL)
+					self._itemconfig(self.play_indicator, text="⏹", fill="#909090", state=tkinter.NORMAL)
 			else:
-				self.parent.main_canvas.itemconfig(self.record_indicator, state=tkinter.HIDDEN)
-
-		if control in [None, 'play']:
-			try:
-				processor = self.chain.synth_slots[0][0]
-				if processor.eng_code == "AP":
-					if zynaudioplayer.get_playback_state(processor.handle):
-						self.parent.main_canvas.itemconfig(self.play_indicator, text="▶", fill="#009000", state=tkinter.NORMAL)
-					else:
-						self.parent.main_canvas.itemconfig(self.play_indicator, text="⏹", fill="#909090", state=tkinter.NORMAL)
-				else:
-					self.parent.main_canvas.itemconfig(self.play_indicator, state=tkinter.HIDDEN)
-			except:
-				self.parent.main_canvas.itemconfig(self.play_indicator, state=tkinter.HIDDEN)
+				self._itemconfig(self.play_indicator, state=tkinter.HIDDEN)
+		except:
+			self._itemconfig(self.play_indicator, state=tkinter.HIDDEN)
+
+	def draw_legend(self):
+		if self.chain_id == 0:
+			self._itemconfig(self.legend_strip_txt, text="Main", font=self.font)
+			return
+		font = self.font
+		if self.parent.moving_chain and self.chain_id == self.parent.chain_manager.active_chain_id:
+			strip_txt = f"⇦⇨"
+		elif isinstance(self.chain.midi_chan, int):
+			if 0 <= self.chain.midi_chan < 16:
+				strip_txt = f"♫ {self.chain.midi_chan + 1}"
+			elif self.chain.midi_chan == 0xffff:
+				strip_txt = f"♫ All"
+			else:
+				strip_txt = f"♫ Err"
+		elif self.is_audio:
+			strip_txt = "\uf130"
+			font = self.font_icons
+		else:
+			strip_txt = "\uf0ae"
+			font = self.font_icons
+			#procs = self.chain.get_processor_count() - 1
+		self._itemconfig(self.legend_strip_txt, text=strip_txt, font=font)
+
+	# Function to draw the whole mixer strip UI
+	def draw_control(self):
+		self.dirty_mask = 0
+		if self.hidden or self.chain is None: # or self.zctrls is None:
+			return
+
+		self.draw_legend()
+		self.draw_fader()
+		if not self.is_audio:
+			if self._audio_items_built:
+				self._itemconfig(self.record_indicator, state=tkinter.HIDDEN)
+				self._itemconfig(self.play_indicator, state=tkinter.HIDDEN)
+			return
+		if self.zctrls:
+			self.draw_level()
+			self.draw_solo()
+			self.draw_mute()
+			self.draw_balance()
+			self.draw_mono()
+		self.draw_rec()
+		self.draw_play()
+
+	# Function to redraw only the controls flagged dirty since the last pass
+	def draw_dirty(self):
+		mask = self.dirty_mask
+		self.dirty_mask = 0
+		if not mask or self.hidden or self.chain is None:
+			return
+		if not self.is_audio:
+			if self._audio_items_built:
+				self._itemconfig(self.record_indicator, state=tkinter.HIDDEN)
+				self._itemconfig(self.play_indicator, state=tkinter.HIDDEN)
+			return
+		if not self.zctrls:
+			mask &= ~self.ZCTRL_BITS
+		drawers = self._bit_drawers
+		while mask:
+			bit = mask & -mask
+			mask ^= bit
+			drawers[bit]()
 
 
 	# --------------------------------------------------------------------------
@@ -448,33 +595,59 @@ class zynthian_gui_mixer_strip():
 	def set_highlight(self, hl=True):
 		if hl:
 			self.set_fader_color(self.fader_bg_color_hl)
-			self.parent.main_canvas.itemconfig(self.legend_strip_bg, fill=self.legend_bg_color_hl)
+			self.main_canvas.itemconfig(self.legend_strip_bg, fill=self.legend_bg_color_hl)
 		else:
 			self.set_fader_color(self.fader_color)
-			self.parent.main_canvas.itemconfig(self.legend_strip_bg, fill=self.fader_bg_color)
+			self.main_canvas.itemconfig(self.legend_strip_bg, fill=self.fader_bg_color)
 
 	# Function to set fader colors
 	# fg: Fader foreground color
 	# bg: Fader background color (optional - Default: Do not change background color)
 	def set_fader_color(self, fg, bg=None):
-		self.parent.main_canvas.itemconfig(self.fader, fill=fg)
+		self.main_canvas.itemconfig(self.fader, fill=fg)
 		if bg:
-			self.parent.main_canvas.itemconfig(self.fader_bg_color, fill=bg)
+			self.main_canvas.itemconfig(self.fader_bg_color, fill=bg)
 
 	# Function to set chain associated with mixer strip
 	#	chain: Chain object
 	def set_chain(self, chain_id):
 		self.chain_id = chain_id
-		self.chain = self.parent.zyngui.chain_manager.get_chain(chain_id)
+		self.chain = self.parent.chain_manager.get_chain(chain_id)
 		if self.chain is None:
+			self.is_audio = False
 			self.hide()
-			self.dpm_a.set_strip(None)
-			self.dpm_b.set_strip(None)
+			if self.dpm_a:
+				self.dpm_a.set_strip(None)
+				self.dpm_b.set_strip(None)
 		else:
+			self.is_audio = bool(self.chain.is_audio())
+			if self.is_audio and not self._audio_items_built:
+				self._build_audio_items()
 			if self.chain.mixer_chan is not None and self.chain.mixer_chan < len(self.parent.zynmixer.zctrls):
 				self.zctrls = self.parent.zynmixer.zctrls[self.chain.mixer_chan]
 			self.show()
 
+	# Function to show a drag feedback title, rate-limited to ~20Hz so motion
+	# events can't force a title repaint per touch sample
+	def set_drag_title(self, title):
+		now = monotonic()
+		if now - self._last_title_ts < 0.05:
+			return
+		# Repush an unchanged title only once its timeout may have reverted it
+		if title != self._last_title or now - self._last_title_ts > 0.8:
+			self._last_title = title
+			self._last_title_ts = now
+			self.parent.set_title(title, None, None, 1)
+
+	# Function to show the current volume in the title bar
+	def show_volume_title(self):
+		value = self.zctrls["level"].value
+		if value > 0:
+			title = _DB_TITLES[min(1023, int(value * 1023))]
+		else:
+			title = "Volume: -∞dB"
+		self.set_drag_title(title)
+
 	# Function to set volume value
 	#	value: Volume value (0..1)
 	def set_volume(self, value):
@@ -482,12 +655,7 @@ class zynthian_gui_mixer_strip():
 			self.parent.enter_midi_learn(self.zctrls["level"])
 		elif self.zctrls:
 			self.zctrls['level'].set_value(value)
-			value = self.zctrls["level"].value
-			if value > 0:
-				level_db = 20 * log10(value)
-				self.parent.set_title(f"Volume: {level_db:.2f}dB", None, None, 1)
-			else:
-				self.parent.set_title("Volume: -∞dB", None, None, 1)
+			self.show_volume_title()
 
 	# Function to get volume value
 	def get_volume(self):
@@ -500,12 +668,7 @@ class zynthian_gui_mixer_strip():
 			self.parent.enter_midi_learn(self.zctrls["level"])
 		elif self.zctrls:
 			self.zctrls["level"].nudge(dval)
-			value = self.zctrls["level"].value
-			if value > 0:
-				level_db = 20 * log10(value)
-				self.parent.set_title(f"Volume: {level_db:.2f}dB", None, None, 1)
-			else:
-				self.parent.set_title("Volume: -∞dB", None, None, 1)
+			self.show_volume_title()
 
 	# Function to set balance value
 	#	value: Balance value (-1..1)
@@ -514,7 +677,7 @@ class zynthian_gui_mixer_strip():
 			self.parent.enter_midi_learn(self.zctrls["balance"])
 		elif self.zctrls:
 			self.zctrls["balance"].set_value(value)
-			self.parent.set_title(f"Balance: {int(value * 100)}%", None, None, 1)
+			self.set_drag_title(f"Balance: {int(value * 100)}%")
 
 	# Function to get balance value
 	def get_balance(self):
@@ -528,7 +691,7 @@ class zynthian_gui_mixer_strip():
 			self.parent.refresh_visible_strips()
 		elif self.zctrls:
 			self.zctrls['balance'].nudge(dval)
-			self.parent.set_title(f"Balance: {int(self.zctrls['balance'].value * 100)}%", None, None, 1)
+			self.set_drag_title(f"Balance: {int(self.zctrls['balance'].value * 100)}%")
 
 	# Function to reset volume
 	def reset_volume(self):
@@ -597,7 +760,7 @@ class zynthian_gui_mixer_strip():
 
 		self.fader_drag_start = event
 		if self.chain:
-			self.parent.zyngui.chain_manager.set_active_chain_by_object(self.chain)
+			self.parent.chain_manager.set_active_chain_by_object(self.chain)
 			self.parent.highlight_active_chain()
 
 	# Function to handle fader press
@@ -608,10 +771,8 @@ class zynthian_gui_mixer_strip():
 	# Function to handle fader drag
 	#	event: Mouse event
 	def on_fader_motion(self, event):
-		if self.touch_ts:
-			dts = monotonic() - self.touch_ts
-
-		if dts < 0.1:  # debounce initial touch
+		ts = self.touch_ts
+		if ts is None or monotonic() - ts < 0.1:  # debounce initial touch
 			return
 		dy = self.touch_y - event.y
 		dx = event.x - self.touch_x
@@ -666,7 +827,7 @@ class zynthian_gui_mixer_strip():
 		self.strip_drag_start = event
 		self.dragging = False
 		if self.chain:
-			self.parent.zyngui.chain_manager.set_active_chain_by_object(self.chain)
+			self.parent.chain_manager.set_active_chain_by_object(self.chain)
 
 	# Function to handle legend strip release
 	def on_strip_release(self, event):
@@ -700,8 +861,8 @@ class zynthian_gui_mixer_strip():
 			# Dragged more than one strip width
 			self.dragging = True
 			if self.parent.moving_chain:
-				self.parent.zyngui.chain_manager.move_chain(offset)
-			elif self.parent.mixer_strip_offset - offset >= 0 and self.parent.mixer_strip_offset - offset + len(self.parent.visible_mixer_strips) <= len(self.parent.zyngui.chain_manager.chains):
+				self.parent.chain_manager.move_chain(offset)
+			elif self.parent.mixer_strip_offset - offset >= 0 and self.parent.mixer_strip_offset - offset + len(self.parent.visible_mixer_strips) <= len(self.parent.chain_manager.chains):
 				self.parent.mixer_strip_offset -= offset
 			self.strip_drag_start.x = event.x
 			self.parent.refresh_visible_strips()
@@ -727,14 +888,25 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 	def __init__(self):
 		super().__init__(has_backbutton=False)
 
-		self.zynmixer = self.zyngui.state_manager.zynmixer
+		# Config flags fixed for the session, bound once for the refresh paths
+		self.enable_dpm = zynthian_gui_config.enable_dpm
+		self.enable_touch_navigation = zynthian_gui_config.enable_touch_navigation
+
+		self.chain_manager = self.zyngui.chain_manager
+		self.state_manager = self.zyngui.state_manager
+		self.zynmixer = self.state_manager.zynmixer
 		self.zynmixer.set_midi_learn_cb(self.enter_midi_learn)
 		self.MAIN_MIXBUS_STRIP_INDEX = self.zynmixer.MAX_NUM_CHANNELS - 1
 		self.chan2strip = [None] * (self.MAIN_MIXBUS_STRIP_INDEX + 1)
 		self.highlighted_strip = None # highligted mixer strip object
 		self.moving_chain = False  # True if moving a chain left/right
 
-		self.pending_refresh_queue = set()  # List of (strip,control) requiring gui refresh (control=None for whole strip refresh)
+		self.dirty_strips = set()  # Strips with a non-zero dirty_mask awaiting gui refresh
+		self._broadcast_dirty = 0  # Dirty bits to apply to every visible strip on the next plot
+		# Encoder handlers indexed by zynpot: layer, back, snapshot, select
+		self._zynpot_handlers = (self.nudge_active_volume, self.nudge_active_balance, self.nudge_main_volume, self.select_chain)
+		self._chain_index = {}  # Map of chain_id => ordinal in ordered_chain_ids, rebuilt on refresh
+		self.chainid2strip = {}  # Map of chain_id => visible strip object, rebuilt on refresh
 		# TODO: Should avoid duplicating midi_learn_zctrl from zynmixer but would need more safeguards to make change.
 		self.midi_learn_sticky = None
 
@@ -748,17 +920,20 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 			elif self.width <= 1280: visible_chains = 14
 			else: visible_chains = 16
 
-		self.fader_width = (self.width - 6 ) / (visible_chains + 1)
-		self.legend_height = self.height * 0.05
-		self.edit_height = self.height * 0.1
-		
+		# Integer pixel geometry, computed once so strip construction and canvas
+		# coords never round floats
+		self.fader_width = (self.width - 6) // (visible_chains + 1)
+		self.legend_height = int(self.height * 0.05)
+		self.edit_height = int(self.height * 0.1)
+
 		self.fader_height = self.height - self.edit_height - self.legend_height - 2
 		self.fader_bottom = self.height - self.legend_height
 		self.fader_top = self.fader_bottom - self.fader_height
-		self.balance_control_height = self.fader_height * 0.1
+		self.balance_control_height = int(self.fader_height * 0.1)
 		self.balance_top = self.fader_top
-		self.balance_control_width = self.width / 4  # Width of each half of balance control
+		self.balance_control_width = self.width // 4  # Width of each half of balance control
 		self.balance_control_centre = self.fader_width + self.balance_control_width
+		self.strip_x = tuple(1 + self.fader_width * i for i in range(visible_chains))
 
 		# Arrays of GUI elements for mixer strips - Chains + Main
 		self.visible_mixer_strips = [None] * visible_chains  # List of mixer strip objects indexed by horizontal position on screen
@@ -774,9 +949,25 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 		self.main_frame.columnconfigure(0, weight=1)
 		self.main_canvas.grid(row=0, sticky='nsew')
 
-		# Create mixer strip UI objects
+		# Single canvas-level mouse dispatch. Strips register their items in
+		# item_handlers instead of stacking per-strip tag_bind callables at the
+		# Tcl level: item id => {action: handler}
+		self.item_handlers = {}
+		self.grab_handlers = None  # Handlers of the item that took the last press
+		self.main_canvas.bind("<ButtonPress-1>", self.on_canvas_press)
+		self.main_canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
+		self.main_canvas.bind("<B1-Motion>", self.on_canvas_b1_motion)
+		self.main_canvas.bind("<Motion>", self.on_canvas_motion)
+		if zynthian_gui_config.force_enable_cursor:
+			self.main_canvas.bind("<Button-4>", self.on_canvas_wheel_up)
+			self.main_canvas.bind("<Button-5>", self.on_canvas_wheel_down)
+
+		# Create mixer strip UI objects. Frozen to a tuple: the strip count
+		# never changes after construction.
 		for strip in range(len(self.visible_mixer_strips)):
-			self.visible_mixer_strips[strip] = zynthian_gui_mixer_strip(self, 1 + self.fader_width * strip, 0, self.fader_width - 1, self.height)
+			self.visible_mixer_strips[strip] = zynthian_gui_mixer_strip(self, self.strip_x[strip], 0, self.fader_width - 1, self.height)
+		self.visible_mixer_strips = tuple(self.visible_mixer_strips)
+		self.n_strips = len(self.visible_mixer_strips)
 
 		self.main_mixbus_strip = zynthian_gui_mixer_strip(self, self.width - self.fader_width - 1, 0, self.fader_width - 1, self.height)
 		self.main_mixbus_strip.set_chain(0)
@@ -787,15 +978,56 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 		self.set_title()
 		self.refresh_visible_strips()
 
+	# Canvas-level mouse event dispatchers. A press takes an implicit grab so
+	# drag and release go to the pressed item, like tag_bind semantics.
+	def on_canvas_press(self, event):
+		item = self.main_canvas.find_withtag("current")
+		handlers = self.item_handlers.get(item[0]) if item else None
+		self.grab_handlers = handlers
+		if handlers and 'press' in handlers:
+			handlers['press'](event)
+
+	def on_canvas_release(self, event):
+		handlers = self.grab_handlers
+		self.grab_handlers = None
+		if handlers and 'release' in handlers:
+			handlers['release'](event)
+
+	def on_canvas_b1_motion(self, event):
+		handlers = self.grab_handlers
+		if handlers and 'b1motion' in handlers:
+			handlers['b1motion'](event)
+
+	def on_canvas_motion(self, event):
+		item = self.main_canvas.find_withtag("current")
+		if item:
+			handlers = self.item_handlers.get(item[0])
+			if handlers and 'motion' in handlers:
+				handlers['motion'](event)
+
+	def on_canvas_wheel_up(self, event):
+		item = self.main_canvas.find_withtag("current")
+		if item:
+			handlers = self.item_handlers.get(item[0])
+			if handlers and 'wheelup' in handlers:
+				handlers['wheelup'](event)
+
+	def on_canvas_wheel_down(self, event):
+		item = self.main_canvas.find_withtag("current")
+		if item:
+			handlers = self.item_handlers.get(item[0])
+			if handlers and 'wheeldown' in handlers:
+				handlers['wheeldown'](event)
+
 	def init_dpmeter(self):
 		self.dpm_a = self.dpm_b = None
 
 	# Redefine set_title
 	def set_title(self, title="Mixer", fg=None, bg=None, timeout = None):
-		if title == "Mixer" and self.zyngui.state_manager.last_snapshot_fpath:
-			fparts = os.path.splitext(self.zyngui.state_manager.last_snapshot_fpath)
+		if title == "Mixer" and self.state_manager.last_snapshot_fpath:
+			fparts = os.path.splitext(self.state_manager.last_snapshot_fpath)
 			if self.zyngui.screens['snapshot'].bankless_mode:
-				ssname = os.path.basename(fparts[0]) + " - " + self.zyngui.state_manager.current_zs3_title
+				ssname = os.path.basename(fparts[0]) + " - " + self.state_manager.current_zs3_title
 			else:
 				ssname = fparts[0].rsplit("/", 1)[-1]
 			title = ssname.replace("last_state", "Last State")
@@ -810,8 +1042,8 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 			if not self.midi_learn_sticky:
 				self.exit_midi_learn()
 				zynsigman.unregister(zynsigman.S_AUDIO_MIXER, self.zynmixer.SS_ZCTRL_SET_VALUE, self.update_control)
-				zynsigman.unregister(zynsigman.S_STATE_MAN, self.zyngui.state_manager.SS_LOAD_ZS3, self.cb_load_zs3)
-				zynsigman.unregister(zynsigman.S_CHAIN_MAN, self.zyngui.chain_manager.SS_SET_ACTIVE_CHAIN, self.update_active_chain)
+				zynsigman.unregister(zynsigman.S_STATE_MAN, self.state_manager.SS_LOAD_ZS3, self.cb_load_zs3)
+				zynsigman.unregister(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_SET_ACTIVE_CHAIN, self.update_active_chain)
 				zynsigman.unregister(zynsigman.S_AUDIO_RECORDER, zynthian_audio_recorder.SS_AUDIO_RECORDER_ARM, self.update_control_arm)
 				zynsigman.unregister(zynsigman.S_AUDIO_RECORDER, zynthian_audio_recorder.SS_AUDIO_RECORDER_STATE, self.update_control_rec)
 				zynsigman.unregister(zynsigman.S_AUDIO_PLAYER, zynthian_engine_audioplayer.SS_AUDIO_PLAYER_STATE, self.update_control_play)
@@ -819,11 +1051,11 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 
 	# Function to handle showing display
 	def build_view(self):
-		if zynthian_gui_config.enable_touch_navigation and self.moving_chain or self.zynmixer.midi_learn_zctrl:
+		if self.enable_touch_navigation and self.moving_chain or self.zynmixer.midi_learn_zctrl:
 			self.show_back_button()
 
 		self.set_title()
-		if zynthian_gui_config.enable_dpm:
+		if self.enable_dpm:
 			self.zynmixer.enable_dpm(0, self.MAIN_MIXBUS_STRIP_INDEX, True)
 		else:
 			# Reset all DPM which will not be updated by refresh
@@ -836,8 +1068,8 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 			self.enter_midi_learn(self.midi_learn_sticky)
 		else:
 			zynsigman.register(zynsigman.S_AUDIO_MIXER, self.zynmixer.SS_ZCTRL_SET_VALUE, self.update_control)
-			zynsigman.register_queued(zynsigman.S_STATE_MAN, self.zyngui.state_manager.SS_LOAD_ZS3, self.cb_load_zs3)
-			zynsigman.register_queued(zynsigman.S_CHAIN_MAN, self.zyngui.chain_manager.SS_SET_ACTIVE_CHAIN, self.update_active_chain)
+			zynsigman.register_queued(zynsigman.S_STATE_MAN, self.state_manager.SS_LOAD_ZS3, self.cb_load_zs3)
+			zynsigman.register_queued(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_SET_ACTIVE_CHAIN, self.update_active_chain)
 			zynsigman.register_queued(zynsigman.S_AUDIO_RECORDER, zynthian_audio_recorder.SS_AUDIO_RECORDER_ARM, self.update_control_arm)
 			zynsigman.register_queued(zynsigman.S_AUDIO_RECORDER, zynthian_audio_recorder.SS_AUDIO_RECORDER_STATE, self.update_control_rec)
 			zynsigman.register_queued(zynsigman.S_AUDIO_PLAYER, zynthian_engine_audioplayer.SS_AUDIO_PLAYER_STATE, self.update_control_play)
@@ -852,32 +1084,56 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 	def refresh_status(self):
 		if self.shown:
 			super().refresh_status()
-			# Update main chain DPM
-			state = self.zynmixer.get_dpm_states(255, 255)[0]
-			self.main_mixbus_strip.draw_dpm(state)
-			# Update other chains DPM
-			if zynthian_gui_config.enable_dpm:
-				states = self.zynmixer.get_dpm_states(0, self.MAIN_MIXBUS_STRIP_INDEX - 1)
+			if self.enable_dpm:
+				# Fetch every channel's DPM state, main mixbus included, in a
+				# single ctypes round-trip
+				states = self.zynmixer.get_dpm_states(0, self.MAIN_MIXBUS_STRIP_INDEX)
+				self.main_mixbus_strip.draw_dpm(states[self.MAIN_MIXBUS_STRIP_INDEX])
 				for strip in self.visible_mixer_strips:
-					if not strip.hidden and strip.chain.mixer_chan is not None:
-						state = states[strip.chain.mixer_chan]
-						strip.draw_dpm(state)
+					if not strip.hidden:
+						mixer_chan = strip.chain.mixer_chan
+						if mixer_chan is not None:
+							strip.draw_dpm(states[mixer_chan])
+			else:
+				# Chain DPMs are disabled but the main mixbus keeps metering
+				state = self.zynmixer.get_dpm_states(255, 255)[0]
+				self.main_mixbus_strip.draw_dpm(state)
+
+	# Maximum of strips redrawn per plot pass - keeps switch/OSC polling on
+	# the control thread responsive when e.g. a snapshot dirties every strip
+	PLOT_BUDGET = 4
 
 	# Function to refresh display (fast)
 	def plot_zctrls(self):
-		while self.pending_refresh_queue:
-			ctrl = self.pending_refresh_queue.pop()
-			if ctrl[0]:
-				ctrl[0].draw_control(ctrl[1])
+		bcast = self._broadcast_dirty
+		if bcast:
+			self._broadcast_dirty = 0
+			for strip in self.visible_mixer_strips:
+				strip.dirty_mask |= bcast
+			self.dirty_strips.update(self.visible_mixer_strips)
+		budget = self.PLOT_BUDGET
+		while self.dirty_strips and budget:
+			self.dirty_strips.pop().draw_dirty()
+			budget -= 1
 
 	# Function to add control to be updated (fast)
+	# Called from the signal thread at MIDI-CC rates, so keep the happy path
+	# to local lookups and drop repeats of the current value
 	def update_control(self, chan, symbol, value):
 		strip = self.chan2strip[chan]
-		if not strip or not strip.chain or strip.chain.mixer_chan is None:
+		if strip is None:
+			return
+		chain = strip.chain
+		if chain is None or chain.mixer_chan is None:
 			return
-		self.pending_refresh_queue.add((strip, symbol))
-		strip.zctrls[symbol].set_value(value, False)
-		#self.pending_refresh_queue.add((self.chan2strip[self.MAIN_MIXBUS_STRIP_INDEX], "solo"))
+		zctrls = strip.zctrls
+		zctrl = zctrls.get(symbol) if zctrls else None
+		if zctrl is not None:
+			if zctrl.value == value:
+				return
+			zctrl.set_value(value, False)
+		strip.dirty_mask |= zynthian_gui_mixer_strip.SYMBOL_BITS.get(symbol, 0)
+		self.dirty_strips.add(strip)
 
 	# Function to handle audio recorder arm
 	def update_control_arm(self, chan, value):
@@ -885,13 +1141,11 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 
 	# Function to handle audio recorder status
 	def update_control_rec(self, state):
-		for strip in self.visible_mixer_strips:
-			self.pending_refresh_queue.add((strip, "rec"))
+		self._broadcast_dirty |= zynthian_gui_mixer_strip.BIT_REC
 
 	# Function to handle audio play status
 	def update_control_play(self, handle, state):
-		for strip in self.visible_mixer_strips:
-			self.pending_refresh_queue.add((strip, "play"))
+		self._broadcast_dirty |= zynthian_gui_mixer_strip.BIT_PLAY
 
 	# Funtion to handle active chain changes
 	def update_active_chain(self, active_chain):
@@ -907,27 +1161,23 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 	# Function to highlight the selected chain's strip
 	def highlight_active_chain(self, refresh=False):
 		"""Higlights active chain, redrawing strips if required"""
-		try:
-			active_index = self.zyngui.chain_manager.ordered_chain_ids.index(self.zyngui.chain_manager.active_chain_id)
-		except:
-			active_index = 0
+		active_chain_id = self.chain_manager.active_chain_id
+		if active_chain_id not in self._chain_index:
+			# Chain list changed since the last refresh => rebuild the ordinals
+			self._chain_index = {cid: i for i, cid in enumerate(self.chain_manager.ordered_chain_ids)}
+		active_index = self._chain_index.get(active_chain_id, 0)
 		if active_index < self.mixer_strip_offset:
 			self.mixer_strip_offset = active_index
 			refresh = True
-		elif active_index >= self.mixer_strip_offset + len(self.visible_mixer_strips) and self.zyngui.chain_manager.active_chain_id != 0:
-			self.mixer_strip_offset = active_index - len(self.visible_mixer_strips) + 1
+		elif active_index >= self.mixer_strip_offset + self.n_strips and self.chain_manager.active_chain_id != 0:
+			self.mixer_strip_offset = active_index - self.n_strips + 1
 			refresh = True
 		#TODO: Handle aux
 
-		strip = None
-		if self.zyngui.chain_manager.active_chain_id == 0:
+		if active_chain_id == 0:
 			strip = self.main_mixbus_strip
 		else:
-			chain = self.zyngui.chain_manager.get_chain(self.zyngui.chain_manager.active_chain_id)
-			for s in self.visible_mixer_strips:
-				if s.chain == chain:
-					strip = s
-					break
+			strip = self.chainid2strip.get(active_chain_id)
 			if strip is None:
 				refresh = True
 		if refresh:
@@ -951,20 +1201,31 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 
 		active_strip = None
 		strip_index = 0
-		for chain_id in self.zyngui.chain_manager.ordered_chain_ids[:-1][self.mixer_strip_offset:self.mixer_strip_offset + len(self.visible_mixer_strips)]:
+		ordered_chain_ids = self.chain_manager.ordered_chain_ids
+		self._chain_index = {cid: i for i, cid in enumerate(ordered_chain_ids)}
+		self.chainid2strip = chainid2strip = {}
+		# The last entry is always main, dropped without copying the whole list
+		end = min(self.mixer_strip_offset + self.n_strips, len(ordered_chain_ids) - 1)
+		for chain_id in ordered_chain_ids[self.mixer_strip_offset:end]:
 			strip = self.visible_mixer_strips[strip_index]
-			strip.set_chain(chain_id)
-			#strip.draw_control()
+			if strip.chain_id != chain_id or strip.chain is not self.chain_manager.get_chain(chain_id):
+				strip.set_chain(chain_id)
+			else:
+				# Already bound to this chain: repaint without rebinding, so
+				# e.g. MIDI-learn state changes still reach the canvas
+				strip.draw_control()
+			chainid2strip[chain_id] = strip
 			if strip.chain.mixer_chan is not None and strip.chain.mixer_chan < len(self.chan2strip):
 				self.chan2strip[strip.chain.mixer_chan] = strip
-			if chain_id == self.zyngui.chain_manager.active_chain_id:
+			if chain_id == self.chain_manager.active_chain_id:
 				active_strip = strip
 			strip_index += 1
 		
 		# Hide unpopulated strips
-		for strip in self.visible_mixer_strips[strip_index:len(self.visible_mixer_strips)]:
-			strip.set_chain(None)
-			strip.zctrls = None
+		for strip in self.visible_mixer_strips[strip_index:]:
+			if strip.chain_id is not None:
+				strip.set_chain(None)
+				strip.zctrls = None
 
 		self.chan2strip[self.MAIN_MIXBUS_STRIP_INDEX] = self.main_mixbus_strip
 		self.main_mixbus_strip.draw_control()
@@ -987,7 +1248,7 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 				self.zyngui.chain_control()
 		elif type == "B":
 			# Chain Options
-			self.zyngui.screens['chain_options'].setup(self.zyngui.chain_manager.active_chain_id)
+			self.zyngui.screens['chain_options'].setup(self.chain_manager.active_chain_id)
 			self.zyngui.show_screen('chain_options')
 		else:
 			return False
@@ -1051,48 +1312,48 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 
 	# Function to handle zynpot CB
 	def zynpot_cb(self, i, dval):
-		if not self.shown:
-			return
+		if self.shown and i < len(self._zynpot_handlers):
+			self._zynpot_handlers[i](dval)
 
-		# LAYER encoder adjusts selected chain's level
-		if i == 0:
-			if self.highlighted_strip is not None:
-				self.highlighted_strip.nudge_volume(dval)
-
-		# BACK encoder adjusts selected chain's balance/pan
-		if i == 1:
-			if self.highlighted_strip is not None:
-				self.highlighted_strip.nudge_balance(dval)
-
-		# SNAPSHOT encoder adjusts main mixbus level
-		elif i == 2:
-			self.main_mixbus_strip.nudge_volume(dval)
-
-		# SELECT encoder moves chain selection
-		elif i == 3:
-			if self.moving_chain:
-				self.zyngui.chain_manager.move_chain(dval)
-				self.refresh_visible_strips()
-			else:
-				self.zyngui.chain_manager.next_chain(dval)
-			self.highlight_active_chain()
+	# LAYER encoder adjusts selected chain's level
+	def nudge_active_volume(self, dval):
+		if self.highlighted_strip is not None:
+			self.highlighted_strip.nudge_volume(dval)
+
+	# BACK encoder adjusts selected chain's balance/pan
+	def nudge_active_balance(self, dval):
+		if self.highlighted_strip is not None:
+			self.highlighted_strip.nudge_balance(dval)
+
+	# SNAPSHOT encoder adjusts main mixbus level
+	def nudge_main_volume(self, dval):
+		self.main_mixbus_strip.nudge_volume(dval)
+
+	# SELECT encoder moves chain selection
+	def select_chain(self, dval):
+		if self.moving_chain:
+			self.chain_manager.move_chain(dval)
+			self.refresh_visible_strips()
+		else:
+			self.chain_manager.next_chain(dval)
+		self.highlight_active_chain()
 
 	# Function to handle CUIA ARROW_LEFT
 	def arrow_left(self):
 		if self.moving_chain:
-			self.zyngui.chain_manager.move_chain(-1)
+			self.chain_manager.move_chain(-1)
 			self.refresh_visible_strips()
 		else:
-			self.zyngui.chain_manager.previous_chain()
+			self.chain_manager.previous_chain()
 		self.highlight_active_chain()
 
 	# Function to handle CUIA ARROW_RIGHT
 	def arrow_right(self):
 		if self.moving_chain:
-			self.zyngui.chain_manager.move_chain(1)
+			self.chain_manager.move_chain(1)
 			self.refresh_visible_strips()
 		else:
-			self.zyngui.chain_manager.next_chain()
+			self.chain_manager.next_chain()
 		self.highlight_active_chain()
 
 	# Function to handle CUIA ARROW_UP
@@ -1117,7 +1378,7 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 				return
 			self.mixer_strip_offset -= 1
 		elif event.num == 4:
-			if self.mixer_strip_offset + len(self.visible_mixer_strips) >= self.zyngui.chain_manager.get_chain_count() - 1:
+			if self.mixer_strip_offset + self.n_strips >= self.chain_manager.get_chain_count() - 1:
 				return
 			self.mixer_strip_offset += 1
 		self.highlight_active_chain()
@@ -1134,26 +1395,27 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 
 	def midi_learn_menu(self):
 		options = {}
-		try:
-			strip_id = self.zynmixer.midi_learn_zctrl.graph_path[0] + 1
+		ml_zctrl = self.zynmixer.midi_learn_zctrl
+		graph_path = getattr(ml_zctrl, "graph_path", None)
+		if graph_path:
+			strip_id = graph_path[0] + 1
 			if strip_id == 17:
 				strip_id = "Main"
 			title = f"MIDI Learn Options ({strip_id})"
-		except:
-			title = f"MIDI Learn Options"
+		else:
+			title = "MIDI Learn Options"
 
-		if isinstance(self.zynmixer.midi_learn_zctrl, zynthian_controller):
-			if self.zynmixer.midi_learn_zctrl.is_toggle:
-				if self.zynmixer.midi_learn_zctrl.midi_cc_momentary_switch:
+		if isinstance(ml_zctrl, zynthian_controller):
+			if ml_zctrl.is_toggle:
+				if ml_zctrl.midi_cc_momentary_switch:
 					options["\u2612 Momentary => Latch"] = "latched"
 				else:
 					options["\u2610 Momentary => Latch"] = "momentary"
-		if isinstance(self.zynmixer.midi_learn_zctrl, zynthian_controller):
-			options[f"Clean MIDI-learn ({self.zynmixer.midi_learn_zctrl.symbol})"] = "clean"
+			options[f"Clean MIDI-learn ({ml_zctrl.symbol})"] = "clean"
 		else:
 			options["Clean MIDI-learn (ALL)"] = "clean"
 
-		self.midi_learn_sticky = self.zynmixer.midi_learn_zctrl
+		self.midi_learn_sticky = ml_zctrl
 		self.zyngui.screens['option'].config(title, options, self.midi_learn_menu_cb)
 		self.zyngui.show_screen('option')
 
@@ -1173,7 +1435,7 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 		if zctrl != True:
 			self.zynmixer.enable_midi_learn(zctrl)
 		self.refresh_visible_strips()
-		if zynthian_gui_config.enable_touch_navigation:
+		if self.enable_touch_navigation:
 			self.show_back_button(True)
 
 	def exit_midi_learn(self):
@@ -1181,7 +1443,7 @@ class zynthian_gui_mixer(zynthian_gui_base.zynthian_gui_base):
 			self.zynmixer.midi_learn_zctrl = None
 			self.zynmixer.disable_midi_learn()
 			self.refresh_visible_strips()
-			if zynthian_gui_config.enable_touch_navigation:
+			if self.enable_touch_navigation:
 				self.show_back_button(False)
 
 	# Pre-select all controls in a chain to allow selection of actual control to MIDI learn
@@ -27,7 +27,6 @@
 import tkinter
 import logging
 from PIL import Image, ImageTk
-from threading import Timer
 
 # Zynthian specific modules
 import zynautoconnect
@@ -37,12 +36,12 @@ from zyngine.zynthian_signal_manager import zynsigman
 
 from . import zynthian_gui_base
 from zyngui import zynthian_gui_config
-from zyngui.zynthian_gui_patterneditor import EDIT_MODE_NONE
 
 
 SELECT_BORDER = zynthian_gui_config.color_on
-INPUT_CHANNEL_LABELS = ['OFF', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14', '15', '16']
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+MODE_ICON_FILES = ["zynpad_mode_oneshot", "zynpad_mode_loop", "zynpad_mode_oneshotall", "zynpad_mode_loopall", "zynpad_mode_oneshotsync", "zynpad_mode_loopsync"]
+STATE_ICON_FILES = ["stopped", "playing", "stopping", "starting"]
 
 # ------------------------------------------------------------------------------
 # Zynthian Step-Sequencer Sequence / Pad Trigger GUI Class
@@ -62,6 +61,15 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		self.zynseq = self.state_manager.zynseq
 		self.chain_manager = self.state_manager.chain_manager
 
+		# Bind the hottest libseq entry points once - saves two attribute lookups
+		# per call on the per-pad refresh and selection paths
+		libseq = self.zynseq.libseq
+		self._get_sequence_state = libseq.getSequenceState
+		self._get_sequence_length = libseq.getSequenceLength
+		self._get_channel = libseq.getChannel
+		self._is_empty = libseq.isEmpty
+		self._get_sequences_in_bank = libseq.getSequencesInBank
+
 		self.ctrl_order = zynthian_gui_config.layout['ctrl_order']
 		self.selected_pad = 0  # Index of selected pad
 		self.redraw_pending = 2  # 0=no refresh pending, 1=update grid, 2=rebuild grid
@@ -71,6 +79,11 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		self.midi_learn = False
 		self.trigger_channel = None
 		self.trigger_device = None
+		# Coalesced signal state - handlers run on signal threads so they only
+		# record the latest value per pad and refresh_status drains on the GUI tick
+		self._pending_pad_states = {}
+		self._pending_progress = {}
+		self._preset_name_cache = {}  # Map of MIDI channel => synth preset name, cleared on full refresh
 
 		# Geometry vars
 		self.select_thickness = 1 + int(self.width / 400)  # Scale thickness of select border based on screen
@@ -87,7 +100,10 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		self.main_frame.columnconfigure(0, weight=1)
 		self.main_frame.rowconfigure(0, weight=1)
 		self.grid_canvas.grid()
-		self.grid_timer = Timer(1.4, self.on_grid_timer) # Grid press and hold timer
+		self._grid_after_id = None  # Pending after() callback id for grid press and hold detection
+		self._last_pad_fonts = None  # Font sizes used during last layout - fonts only reconfigured when changed
+		self._visible_tag_cols = None  # Grid size the "visible" canvas tag was built for
+		self._last_grid_geom = None  # (columns, width, height) of the last grid reflow
 
 		self.build_grid()
 
@@ -117,6 +133,8 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		if self.shown:
 			zynsigman.unregister(zynsigman.S_STEPSEQ, self.zynseq.SS_SEQ_PLAY_STATE, self.update_play_state)
 			zynsigman.unregister(zynsigman.S_STEPSEQ, self.zynseq.SS_SEQ_PROGRESS, self.update_progress)
+			self._pending_pad_states.clear()
+			self._pending_progress.clear()
 			super().hide()
 
 	# Function to set quantity of pads
@@ -155,6 +173,7 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		fs2 = int(row_height * 0.11)
 		self.selection = self.grid_canvas.create_rectangle(0, 0, int(self.column_width), int(self.row_height), fill="", outline=SELECT_BORDER, width=self.select_thickness, tags="selection")
 
+		self._pad_cache = [None] * 64  # Last drawn state of each pad - used to skip redundant itemconfig calls
 		self.pads = []
 		for pad in range(64):
 			pad_struct = {}
@@ -203,62 +222,98 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		self.grid_canvas.tag_bind("pad", '<Button-1>', self.on_pad_press)
 		self.grid_canvas.tag_bind("pad", '<ButtonRelease-1>', self.on_pad_release)
 
-		# Icons
+		# Icons - resized lazily per grid size on first use
 		self.empty_icon = tkinter.PhotoImage()
-		self.mode_icon = [[] for i in range(9)]
-		self.state_icon = [[] for i in range(9)]
-
-		for columns in range(1, 9):
-			column_width = self.width / columns
-			row_height = self.height / columns
-			lst = [self.empty_icon]  # Not sure this is right - should be a ImageTk.PhotoImage
-			iconsize = (int(column_width * 0.22), int(row_height * 0.2))
-			for f in ["zynpad_mode_oneshot", "zynpad_mode_loop", "zynpad_mode_oneshotall", "zynpad_mode_loopall", "zynpad_mode_oneshotsync", "zynpad_mode_loopsync"]:
-				img = Image.open(f"/zynthian/zynthian-ui/icons/{f}.png")
-				lst.append(ImageTk.PhotoImage(img.resize(iconsize)))
-			self.mode_icon[columns] = lst.copy()
-			iconsize = (int(row_height * 0.18), int(row_height * 0.18))
-			lst = []
-			for f in ["stopped", "playing", "stopping", "starting"]:
-				img = Image.open(f"/zynthian/zynthian-ui/icons/{f}.png")
-				lst.append(ImageTk.PhotoImage(img.resize(iconsize)))
-			self.state_icon[columns] = lst.copy()
+		self.mode_icon = {}  # Map of grid size => list of mode icons
+		self.state_icon = {}  # Map of grid size => list of state icons
+		self._mode_src = None  # Source PIL images, decoded once and shared by all sizes
+		self._state_src = None
+
+	# Function to build pad icons for a grid size on first use
+	#  columns: Quantity of columns in grid
+	def ensure_icons(self, columns):
+		if columns in self.mode_icon:
+			return
+		if self._mode_src is None:
+			self._mode_src = [Image.open(f"/zynthian/zynthian-ui/icons/{f}.png") for f in MODE_ICON_FILES]
+			self._state_src = [Image.open(f"/zynthian/zynthian-ui/icons/{f}.png") for f in STATE_ICON_FILES]
+		column_width = self.width / columns
+		row_height = self.height / columns
+		lst = [self.empty_icon]  # Not sure this is right - should be a ImageTk.PhotoImage
+		iconsize = (int(column_width * 0.22), int(row_height * 0.2))
+		for img in self._mode_src:
+			lst.append(ImageTk.PhotoImage(img.resize(iconsize)))
+		self.mode_icon[columns] = lst
+		iconsize = (int(row_height * 0.18), int(row_height * 0.18))
+		lst = []
+		for img in self._state_src:
+			lst.append(ImageTk.PhotoImage(img.resize(iconsize)))
+		self.state_icon[columns] = lst
 
 	# Function to clear and calculate grid sizes
 	def update_grid(self):
+		# Reflow is pure geometry, so skip the ~500 canvas calls when neither
+		# the grid size nor the canvas size changed since the last layout
+		geom = (self.zynseq.col_in_bank, self.width, self.height)
+		if geom == self._last_grid_geom:
+			return
+		self._last_grid_geom = geom
 		self.redrawing = True
 		self.column_width = self.width / self.zynseq.col_in_bank
 		self.row_height = self.height / self.zynseq.col_in_bank
+		self.columns = self.zynseq.col_in_bank
+		self._pad_cache = [None] * 64  # Icon sizes change with grid size so force full pad redraw
 
-		# Update pads location / size
-		fs1 = int(self.row_height * 0.15)
-		fs2 = int(self.row_height * 0.11)
+		# Update pads location / size - hoist the per-pad invariants out of the loop
+		column_width = self.column_width
+		row_height = self.row_height
+		fs1 = int(row_height * 0.15)
+		fs2 = int(row_height * 0.11)
+		header_h = int(0.28 * row_height)
+		title_width = int(0.96 * column_width)
+		posx_off = int(0.02 * column_width)
+		posy_off1 = int(0.04 * row_height)
+		posy_off2 = int(0.05 * row_height)
+		group_x = int(3 * 0.125 * column_width)
+		num_x = int(5 * 0.125 * column_width)
+		state_x = int(7 * 0.125 * column_width)
+		title_x_off = int(0.03 * column_width)
+		font1 = (zynthian_gui_config.font_family, fs1)
+		font2 = (zynthian_gui_config.font_family, fs2)
+		fonts_changed = (fs1, fs2, title_width) != self._last_pad_fonts
+		xs = [int(col * column_width) for col in range(self.zynseq.col_in_bank)]
+		ys = [int(row * row_height) for row in range(self.zynseq.col_in_bank)]
 		self.grid_canvas.itemconfig("pad", state=tkinter.HIDDEN)
+		# Retag the visible subset when the grid size changes, then show it in one call
+		if self._visible_tag_cols != self.zynseq.col_in_bank:
+			self.grid_canvas.dtag("visible", "visible")
+			for pad in range(self.zynseq.col_in_bank ** 2):
+				self.grid_canvas.addtag_withtag("visible", f"pad:{pad}")
+			self._visible_tag_cols = self.zynseq.col_in_bank
+		self.grid_canvas.itemconfig("visible", state=tkinter.NORMAL)
 		self.update_selection_cursor()
 		for col in range(self.zynseq.col_in_bank):
-			pad_x = int(col * self.column_width)
+			pad_x = xs[col]
 			for row in range(self.zynseq.col_in_bank):
-				pad_y = int(row * self.row_height)
+				pad_y = ys[row]
 				pad = row + col * self.zynseq.col_in_bank
-				header_h = int(0.28 * self.row_height)
-				self.grid_canvas.itemconfig(self.pads[pad]["group"], font=(zynthian_gui_config.font_family, fs2))
-				self.grid_canvas.itemconfig(self.pads[pad]["num"], font=(zynthian_gui_config.font_family, fs2))
-				self.grid_canvas.itemconfig(self.pads[pad]["title"], width=int(0.96 * self.column_width), font=(zynthian_gui_config.font_family, fs1))
-				self.grid_canvas.itemconfig(f"pad:{pad}", state=tkinter.NORMAL)
-				self.grid_canvas.coords(self.pads[pad]["header"], pad_x, pad_y, pad_x + self.column_width - 2, pad_y + header_h)
-				self.grid_canvas.coords(self.pads[pad]["body"], pad_x, pad_y + header_h, pad_x + self.column_width - 2, pad_y + self.row_height - 2)
-				posx = pad_x + int(0.02 * self.column_width)
-				posy = pad_y + int(0.04 * self.row_height)
+				if fonts_changed:
+					self.grid_canvas.itemconfig(self.pads[pad]["group"], font=font2)
+					self.grid_canvas.itemconfig(self.pads[pad]["num"], font=font2)
+					self.grid_canvas.itemconfig(self.pads[pad]["title"], width=title_width, font=font1)
+				self.grid_canvas.coords(self.pads[pad]["header"], pad_x, pad_y, pad_x + column_width - 2, pad_y + header_h)
+				self.grid_canvas.coords(self.pads[pad]["body"], pad_x, pad_y + header_h, pad_x + column_width - 2, pad_y + row_height - 2)
+				posx = pad_x + posx_off
+				posy = pad_y + posy_off1
 				self.grid_canvas.coords(self.pads[pad]["mode"], posx + int(0.125), posy)
-				posy = pad_y + int(0.05 * self.row_height)
-				self.grid_canvas.coords(self.pads[pad]["group"], posx + int(3 * 0.125 * self.column_width), posy)
-				self.grid_canvas.coords(self.pads[pad]["num"], posx + int(5 * 0.125 * self.column_width), posy)
-				self.grid_canvas.coords(self.pads[pad]["state"], posx + int(7 * 0.125 * self.column_width), posy)
-				posx = pad_x + int(0.03 * self.column_width)
-				self.grid_canvas.coords(self.pads[pad]["title"], posx, posy + 2 * fs1)
+				posy = pad_y + posy_off2
+				self.grid_canvas.coords(self.pads[pad]["group"], posx + group_x, posy)
+				self.grid_canvas.coords(self.pads[pad]["num"], posx + num_x, posy)
+				self.grid_canvas.coords(self.pads[pad]["state"], posx + state_x, posy)
+				self.grid_canvas.coords(self.pads[pad]["title"], pad_x + title_x_off, posy + 2 * fs1)
+		self._last_pad_fonts = (fs1, fs2, title_width)
 
 		self.redrawing = False
-		self.columns = self.zynseq.col_in_bank
 
 	# Function to refresh pad if it has changed
 	#  pad: Pad index
@@ -270,7 +325,7 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 			return
 		# Get pad info if needed
 		if mode is None or state is None or group is None:
-			state = self.zynseq.libseq.getSequenceState(self.zynseq.bank, pad)
+			state = self._get_sequence_state(self.zynseq.bank, pad)
 			mode = (state >> 8) & 0xFF
 			group = (state >> 16) & 0xFF
 			state &= 0xFF
@@ -280,45 +335,68 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 			state = zynseq.SEQ_STOPPING
 
 		foreground = "white"
-		cellh = self.pads[pad]["header"]
-		cellb = self.pads[pad]["body"]
-		if self.zynseq.libseq.getSequenceLength(self.bank, pad) == 0 or mode == zynseq.SEQ_DISABLED:
-			self.grid_canvas.itemconfig(cellh, fill=zynthian_gui_config.PAD_COLOUR_DISABLED)
-			self.grid_canvas.itemconfig(cellb, fill=zynthian_gui_config.PAD_COLOUR_DISABLED_LIGHT)
+		seq_len = self._get_sequence_length(self.bank, pad)
+		if seq_len == 0 or mode == zynseq.SEQ_DISABLED:
+			fill_h = zynthian_gui_config.PAD_COLOUR_DISABLED
+			fill_b = zynthian_gui_config.PAD_COLOUR_DISABLED_LIGHT
 		else:
-			self.grid_canvas.itemconfig(cellh, fill=zynthian_gui_config.PAD_COLOUR_GROUP[group % 16])
-			self.grid_canvas.itemconfig(cellb, fill=zynthian_gui_config.PAD_COLOUR_GROUP_LIGHT[group % 16])
-		if self.zynseq.libseq.getSequenceLength(self.bank, pad) == 0:
+			fill_h = zynthian_gui_config.PAD_COLOUR_GROUP[group % 16]
+			fill_b = zynthian_gui_config.PAD_COLOUR_GROUP_LIGHT[group % 16]
+		if seq_len == 0:
 			mode = 0
 		group = chr(65 + group)
-		#patnum = self.zynseq.libseq.getPatternAt(self.bank, pad, 0, 0)
-		midi_chan = self.zynseq.libseq.getChannel(self.bank, pad, 0)
+		midi_chan = self._get_channel(self.bank, pad, 0)
 		title = self.zynseq.get_sequence_name(self.bank, pad)
-		try:
-			str(int(title))  # Test for default (integer index)
-			title = self.chain_manager.get_synth_preset_name(midi_chan)
-		except:
-			pass
-		self.grid_canvas.itemconfig(self.pads[pad]["title"], text=title, fill=foreground)
-		self.grid_canvas.itemconfig(self.pads[pad]["group"], text=f"CH{midi_chan + 1}", fill=foreground)
-		self.grid_canvas.itemconfig(self.pads[pad]["num"], text=f"{group}{pad+1}", fill=foreground)
-		self.grid_canvas.itemconfig(self.pads[pad]["mode"], image=self.mode_icon[self.zynseq.col_in_bank][mode])
-		if state == 0 and self.zynseq.libseq.isEmpty(self.bank, pad):
-			self.grid_canvas.itemconfig(self.pads[pad]["state"], image=self.empty_icon)
-		else:
-			self.grid_canvas.itemconfig(self.pads[pad]["state"], image=self.state_icon[self.zynseq.col_in_bank][state])
+		if title.isdigit():  # Default sequence names are the integer index => show preset name instead
+			try:
+				title = self._preset_name_cache[midi_chan]
+			except KeyError:
+				title = self._preset_name_cache[midi_chan] = self.chain_manager.get_synth_preset_name(midi_chan)
+		empty = state == 0 and self._is_empty(self.bank, pad)
+
+		# Only push fields that differ from the last drawn state to the canvas
+		current = (fill_h, fill_b, title, midi_chan, group, mode, state, empty)
+		last = self._pad_cache[pad]
+		if current == last:
+			return
+		if last is None:
+			last = (None,) * 8
+		pad_struct = self.pads[pad]
+		if fill_h != last[0]:
+			self.grid_canvas.itemconfig(pad_struct["header"], fill=fill_h)
+		if fill_b != last[1]:
+			self.grid_canvas.itemconfig(pad_struct["body"], fill=fill_b)
+		if title != last[2]:
+			self.grid_canvas.itemconfig(pad_struct["title"], text=title, fill=foreground)
+		if midi_chan != last[3]:
+			self.grid_canvas.itemconfig(pad_struct["group"], text=f"CH{midi_chan + 1}", fill=foreground)
+		if group != last[4]:
+			self.grid_canvas.itemconfig(pad_struct["num"], text=f"{group}{pad+1}", fill=foreground)
+		self.ensure_icons(self.zynseq.col_in_bank)
+		if mode != last[5]:
+			self.grid_canvas.itemconfig(pad_struct["mode"], image=self.mode_icon[self.zynseq.col_in_bank][mode])
+		if state != last[6] or empty != last[7]:
+			if empty:
+				self.grid_canvas.itemconfig(pad_struct["state"], image=self.empty_icon)
+			else:
+				self.grid_canvas.itemconfig(pad_struct["state"], image=self.state_icon[self.zynseq.col_in_bank][state])
+		self._pad_cache[pad] = current
 
 	def update_play_state(self, bank, seq, state, mode, group):
 		if bank == self.bank:
-			self.refresh_pad(seq, mode=mode, state=state, group=group)
+			self._pending_pad_states[seq] = (mode, state, group)
 
 	def update_progress(self, bank, seq, progress):
 		if bank == self.bank:
-			x0 = int(seq / self.columns) * self.column_width
-			y0 = (seq % self.columns + 1) * self.row_height - 8
-			x1 = x0 + int(progress * self.column_width / 100)
-			y1 = y0 + 4
-			self.grid_canvas.coords(self.pads[seq]["progress"], x0, y0, x1, y1)
+			self._pending_progress[seq] = progress
+
+	# Function to draw sequence progress bar
+	def draw_progress(self, seq, progress):
+		x0 = int(seq / self.columns) * self.column_width
+		y0 = (seq % self.columns + 1) * self.row_height - 8
+		x1 = x0 + int(progress * self.column_width / 100)
+		y1 = y0 + 4
+		self.grid_canvas.coords(self.pads[seq]["progress"], x0, y0, x1, y1)
 
 	# ------------------------------------------------------------------------------------------------------------------
 	# Some useful functions
@@ -329,18 +407,23 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		self.zynseq.select_bank(bank)
 		self.refresh_status(force=True)
 
-	# Function to move selection cursor
-	def update_selection_cursor(self):
-		# TODO: Was update_selection_cursor removed during refactor and replaced during merge?
-		if self.selected_pad >= self.zynseq.libseq.getSequencesInBank(self.bank):
-			self.selected_pad = self.zynseq.libseq.getSequencesInBank(self.bank) - 1
-		col = int(self.selected_pad / self.zynseq.col_in_bank)
-		row = self.selected_pad % self.zynseq.col_in_bank
+	# Function to position the selection cursor over a pad
+	#  pad: Index of pad
+	def _place_selection(self, pad):
+		col = int(pad / self.columns)
+		row = pad % self.columns
 		self.grid_canvas.coords(self.selection,
-				1 + col * self.column_width, 1 + row * self.row_height,
-				(1 + col) * self.column_width - self.select_thickness, (1 + row) * self.row_height - self.select_thickness)
+			1 + col * self.column_width, 1 + row * self.row_height,
+			(1 + col) * self.column_width - self.select_thickness, (1 + row) * self.row_height - self.select_thickness)
 		self.grid_canvas.tag_raise(self.selection)
 
+	# Function to move selection cursor
+	def update_selection_cursor(self):
+		n_seqs = self._get_sequences_in_bank(self.bank)
+		if self.selected_pad >= n_seqs:
+			self.selected_pad = n_seqs - 1
+		self._place_selection(self.selected_pad)
+
 	# Function to handle pad press
 	def on_pad_press(self, event):
 		tags = self.grid_canvas.gettags(self.grid_canvas.find_withtag(tkinter.CURRENT))
@@ -348,14 +431,16 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 		self.select_pad(pad)
 		if self.param_editor_zctrl:
 			self.disable_param_editor()
-		self.grid_timer = Timer(zynthian_gui_config.zynswitch_bold_seconds, self.on_grid_timer)
-		self.grid_timer.start()
+		if self._grid_after_id:
+			self.grid_canvas.after_cancel(self._grid_after_id)
+		self._grid_after_id = self.grid_canvas.after(int(1000 * zynthian_gui_config.zynswitch_bold_seconds), self.on_grid_timer)
 
 	# Function to handle pad release
 	def on_pad_release(self, event):
-		if self.grid_timer.is_alive():
+		if self._grid_after_id:
+			self.grid_canvas.after_cancel(self._grid_after_id)
+			self._grid_after_id = None
 			self.toggle_pad()
-		self.grid_timer.cancel()
 
 	# Function to toggle pad
 	def toggle_pad(self):
@@ -363,6 +448,7 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 
 	# Function to handle grid press and hold
 	def on_grid_timer(self):
+		self._grid_after_id = None
 		self.gridDragStart = None
 		self.show_pattern_editor()
 
@@ -433,7 +519,8 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 					labels.append(f"{midi_chan + 1} ({preset_name})")
 				else:
 					labels.append(f"{midi_chan + 1}")
-			self.enable_param_editor(self, 'midi_chan', {'name': 'MIDI channel', 'labels': labels, 'value_default': self.zynseq.libseq.getChannel(self.bank, self.selected_pad, 0), 'value': self.zynseq.libseq.getChannel(self.bank, self.selected_pad, 0)})
+			chan = self._get_channel(self.bank, self.selected_pad, 0)
+			self.enable_param_editor(self, 'midi_chan', {'name': 'MIDI channel', 'labels': labels, 'value_default': chan, 'value': chan})
 		elif params == 'Track type':
 			track_type = self.zynseq.libseq.getTrackType(self.bank, self.selected_pad, 0)
 			if track_type >= 1:
@@ -533,6 +620,8 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 
 	# Function to refresh pads
 	def refresh_status(self, force=False):
+		if not self.shown and not force:
+			return
 		super().refresh_status()
 
 		if self.redrawing and not force:
@@ -544,22 +633,28 @@ class zynthian_gui_zynpad(zynthian_gui_base.zynthian_gui_base):
 			self.set_title(f"Scene {self.bank}")
 			if self.columns != self.zynseq.col_in_bank:
 				self.update_grid()
+			self._pending_pad_states.clear()  # Full sweep reads authoritative state
+			self._preset_name_cache.clear()
 			for pad in range(self.zynseq.col_in_bank ** 2):
 				self.refresh_pad(pad)
 
+		# Drain coalesced signal state - one redraw per pad however many events arrived
+		while self._pending_pad_states:
+			seq, (mode, state, group) = self._pending_pad_states.popitem()
+			self.refresh_pad(seq, mode=mode, state=state, group=group)
+		while self._pending_progress:
+			seq, progress = self._pending_progress.popitem()
+			self.draw_progress(seq, progress)
+
 	# Function to select a pad
 	#  pad: Index of pad to select (Default: refresh existing selection)
 	def select_pad(self, pad=None):
 		if pad is not None:
 			self.selected_pad = pad
-		if self.selected_pad >= self.zynseq.libseq.getSequencesInBank(self.zynseq.bank):
-			self.selected_pad = self.zynseq.libseq.getSequencesInBank(self.zynseq.bank) - 1
-		col = int(self.selected_pad / self.columns)
-		row = self.selected_pad % self.columns
-		self.grid_canvas.coords(self.selection,
-			1 + col * self.column_width, 1 + row * self.row_height,
-			(1 + col) * self.column_width - self.select_thickness, (1 + row) * self.row_height - self.select_thickness)
-		self.grid_canvas.tag_raise(self.selection)
+		n_seqs = self._get_sequences_in_bank(self.zynseq.bank)
+		if self.selected_pad >= n_seqs:
+			self.selected_pad = n_seqs - 1
+		self._place_selection(self.selected_pad)
 
 	# Function to handle zynpots value change
 	#  encoder: Zynpot index [0..n]
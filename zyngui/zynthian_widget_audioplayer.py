@@ -27,7 +27,7 @@ import logging
 import tkinter
 import soundfile
 import traceback
-from math import modf, sqrt
+from math import modf
 from os.path import basename
 from threading import Thread
 
@@ -52,6 +52,11 @@ class zynthian_wsleds_base:
 		self.blink_state = False
 		self.pulse_step = 0
 		self.last_wsled_state = ""
+		self.power_save_cleared = False
+		self.led_state = []  # Shadow of last written colors - set_led skips unchanged pixels
+		self.led_dirty = False
+		self.screen_cb = None  # Cached update_wsleds() callback of the current screen
+		self.screen_cb_name = None
 		self.brightness = 1
 		self.setup_colors()
 
@@ -112,6 +117,7 @@ class zynthian_wsleds_base:
 			try:
 				self.spi_board = board.SPI()
 				self.wsleds = neopixel.NeoPixel_SPI(self.spi_board, self.num_leds, pixel_order=neopixel.GRB, auto_write=False, frequency=self.spi_freq)
+				self.led_state = [None] * self.num_leds
 				self.light_on_all()
 			except Exception as e:
 				self.wsleds = None
@@ -124,7 +130,12 @@ class zynthian_wsleds_base:
 		return self.num_leds
 
 	def set_led(self, i, wscolor):
-		self.wsleds[i] = wscolor
+		# Writing a pixel costs a Python-level repack in the neopixel driver,
+		# so skip pixels that already hold the requested color
+		if self.led_state[i] != wscolor:
+			self.led_state[i] = wscolor
+			self.led_dirty = True
+			self.wsleds[i] = wscolor
 
 	def get_led(self, i):
 		color = self.wsleds[i]
@@ -134,21 +145,23 @@ class zynthian_wsleds_base:
 		if self.num_leds > 0:
 			# Light all LEDs
 			for i in range(0, self.num_leds):
-				self.wsleds[i] = self.wscolor_default
+				self.set_led(i, self.wscolor_default)
 			self.wsleds.show()
+			self.led_dirty = False
 
 	def light_off_all(self):
 		if self.num_leds > 0:
 			# Light-off all LEDs
 			for i in range(0, self.num_leds):
-				self.wsleds[i] = self.wscolor_off
+				self.set_led(i, self.wscolor_off)
 			self.wsleds.show()
+			self.led_dirty = False
 
 	def blink(self, i, color):
 		if self.blink_state:
-			self.wsleds[i] = color
+			self.set_led(i, color)
 		else:
-			self.wsleds[i] = self.wscolor_off
+			self.set_led(i, self.wscolor_off)
 
 	def pulse(self, i):
 		if self.blink_state:
@@ -161,7 +174,7 @@ class zynthian_wsleds_base:
 			color = self.wscolor_off
 			self.pulse_step = 0
 
-		self.wsleds[i] = color
+		self.set_led(i, color)
 
 	def update(self):
 		# Power Save Mode
@@ -170,13 +183,19 @@ class zynthian_wsleds_base:
 				self.blink_state = True
 			else:
 				self.blink_state = False
-			for i in range(0, self.num_leds):
-				self.wsleds[i] = self.wscolor_off
+			# All LEDs stay off in power save, so clear the strip on entry only
+			if not self.power_save_cleared:
+				for i in range(0, self.num_leds):
+					self.set_led(i, self.wscolor_off)
+				self.power_save_cleared = True
 			self.pulse(0)
-			self.wsleds.show()
+			if self.led_dirty:
+				self.wsleds.show()
+				self.led_dirty = False
 
 		# Normal mode
 		else:
+			self.power_save_cleared = False
 			if self.blink_count % 4 > 1:
 				self.blink_state = True
 			else:
@@ -185,7 +204,11 @@ class zynthian_wsleds_base:
 				self.update_wsleds()
 			except Exception as e:
 				logging.exception(traceback.format_exc())
-			self.wsleds.show()
+			# Pushing the strip over SPI is the most expensive step, so only
+			# refresh when some pixel actually changed since the last show
+			if self.led_dirty:
+				self.wsleds.show()
+				self.led_dirty = False
 
 			if self.zyngui.capture_log_fname:
 				try:
@@ -207,6 +230,15 @@ class zynthian_wsleds_base:
 	def reset_last_state(self):
 		self.last_wsled_state = ""
 
+	def get_screen_wsleds_cb(self, curscreen, curscreen_obj):
+		# Resolve the current screen's update_wsleds() callback only on screen
+		# change, saving a getattr per frame on the refresh path
+		if curscreen != self.screen_cb_name:
+			self.screen_cb_name = curscreen
+			cb = getattr(curscreen_obj, "update_wsleds", None)
+			self.screen_cb = cb if callable(cb) else None
+		return self.screen_cb
+
 	def update_wsleds(self):
 		pass
 
@@ -32,7 +32,23 @@ from zyngui.zynthian_wsleds_base import zynthian_wsleds_base
 
 
 class zynthian_wsleds_v5(zynthian_wsleds_base):
-	
+
+	# Screen-indicator LEDs, all defaulted each frame except the mapped one
+	SCREEN_LEDS = (1, 2, 3, 5)
+	# Map of screen name => (LED, highlight color attribute)
+	SCREEN_LED_MAP = {
+		"audio_mixer": (1, "wscolor_active"),
+		"alsa_mixer": (1, "wscolor_active2"),
+		"control": (2, "wscolor_active"),
+		"audio_player": (2, "wscolor_active"),
+		"preset": (2, "wscolor_active2"),
+		"bank": (2, "wscolor_active2"),
+		"zs3": (3, "wscolor_active"),
+		"snapshot": (3, "wscolor_active2"),
+		"zynpad": (5, "wscolor_active"),
+		"pattern_editor": (5, "wscolor_active2"),
+	}
+
 	def __init__(self, zyngui):
 		super().__init__(zyngui)
 		self.num_leds = 20
@@ -46,110 +62,98 @@ class zynthian_wsleds_v5(zynthian_wsleds_base):
 		self.custom_wsleds = [7, 8, 9, 10, 14, 16, 17, 18, 15, 13, 4, 11, 12, 19]
 
 	def update_wsleds(self):
-		curscreen = self.zyngui.current_screen
-		curscreen_obj = self.zyngui.get_current_screen_obj()
+		# Hoist the per-frame lookups - this runs at the refresh rate and every
+		# self.zyngui.x.y chain costs repeated attribute/dict probes
+		zyngui = self.zyngui
+		state_manager = zyngui.state_manager
+		set_led = self.set_led
+		blink_state = self.blink_state
+		alt_mode = zyngui.alt_mode
+		curscreen = zyngui.current_screen
+		curscreen_obj = zyngui.get_current_screen_obj()
+		wscolor_default = self.wscolor_default
+		wscolor_active = self.wscolor_active
+		wscolor_active2 = self.wscolor_active2
+		wscolor_red = self.wscolor_red
+		wscolor_green = self.wscolor_green
+		wscolor_yellow = self.wscolor_yellow
 
 		# Menu / Admin
-		if self.zyngui.is_current_screen_menu():
-			self.wsleds[0] = self.wscolor_active
-		elif self.zyngui.is_current_screen_admin():
-			self.wsleds[0] = self.wscolor_active2
-		else:
-			self.wsleds[0] = self.wscolor_default
-
-		# Audio Mixer / ALSA Mixer
-		if curscreen == "audio_mixer":
-			self.wsleds[1] = self.wscolor_active
-		elif curscreen == "alsa_mixer":
-			self.wsleds[1] = self.wscolor_active2
-		else:
-			self.wsleds[1] = self.wscolor_default
-
-		# Control / Preset Screen:
-		if curscreen in ("control", "audio_player"):
-			self.wsleds[2] = self.wscolor_active
-		elif curscreen in ("preset", "bank"):
-			self.wsleds[2] = self.wscolor_active2
+		if zyngui.is_current_screen_menu():
+			set_led(0, wscolor_active)
+		elif zyngui.is_current_screen_admin():
+			set_led(0, wscolor_active2)
 		else:
-			self.wsleds[2] = self.wscolor_default
-
-		# ZS3 / Snapshot:
-		if curscreen == "zs3":
-			self.wsleds[3] = self.wscolor_active
-		elif curscreen == "snapshot":
-			self.wsleds[3] = self.wscolor_active2
+			set_led(0, wscolor_default)
+
+		# Screen-indicator LEDs (audio/ALSA mixer, control/preset, ZS3/snapshot,
+		# zynpad/pattern editor): one dict lookup instead of a chain of string
+		# comparisons, then default the remaining LEDs
+		mapped = self.SCREEN_LED_MAP.get(curscreen)
+		if mapped:
+			led, color_name = mapped
+			set_led(led, getattr(self, color_name))
 		else:
-			self.wsleds[3] = self.wscolor_default
-
-		# Zynseq: Zynpad /Pattern Editor
-		if curscreen == "zynpad":
-			self.wsleds[5] = self.wscolor_active
-		elif curscreen == "pattern_editor":
-			self.wsleds[5] = self.wscolor_active2
-		else:
-			self.wsleds[5] = self.wscolor_default
+			led = None
+		for i in self.SCREEN_LEDS:
+			if i != led:
+				set_led(i, wscolor_default)
 
 		# Tempo Screen
 		if curscreen == "tempo":
-			self.wsleds[6] = self.wscolor_active
-		elif self.zyngui.state_manager.zynseq.libseq.isMetronomeEnabled():
-			self.blink(6, self.wscolor_active)
+			set_led(6, wscolor_active)
+		elif state_manager.zynseq.libseq.isMetronomeEnabled():
+			set_led(6, wscolor_active if blink_state else self.wscolor_off)
 		else:
-			self.wsleds[6] = self.wscolor_default
+			set_led(6, wscolor_default)
 
 		# ALT button:
-		if self.zyngui.alt_mode:
-			self.wsleds[7] = self.wscolor_alt
+		if alt_mode:
+			set_led(7, self.wscolor_alt)
 		else:
-			self.wsleds[7] = self.wscolor_default
+			set_led(7, wscolor_default)
 
-		if self.zyngui.alt_mode and curscreen != "midi_recorder":
-			self.zyngui.screens["midi_recorder"].update_wsleds(self.custom_wsleds)
+		if alt_mode and curscreen != "midi_recorder":
+			zyngui.screens["midi_recorder"].update_wsleds(self.custom_wsleds)
 		else:
 			# REC Button
-			if self.zyngui.state_manager.audio_recorder.rec_proc:
-				self.wsleds[8] = self.wscolor_red
+			if state_manager.audio_recorder.rec_proc:
+				set_led(8, wscolor_red)
 			else:
-				self.wsleds[8] = self.wscolor_default
+				set_led(8, wscolor_default)
 			# STOP button
-			self.wsleds[9] = self.wscolor_default
+			set_led(9, wscolor_default)
 			# PLAY button:
-			if self.zyngui.state_manager.status_audio_player:
-				self.wsleds[10] = self.wscolor_green
+			if state_manager.status_audio_player:
+				set_led(10, wscolor_green)
 			else:
-				self.wsleds[10] = self.wscolor_default
+				set_led(10, wscolor_default)
 
 		# Select/Yes button
-		self.wsleds[13] = self.wscolor_green
+		set_led(13, wscolor_green)
 
 		# Back/No button
-		self.wsleds[15] = self.wscolor_red
+		set_led(15, wscolor_red)
 
 		# Arrow buttons (Up, Left, Bottom, Right)
-		self.wsleds[14] = self.wscolor_yellow
-		self.wsleds[16] = self.wscolor_yellow
-		self.wsleds[17] = self.wscolor_yellow
-		self.wsleds[18] = self.wscolor_yellow
+		set_led(14, wscolor_yellow)
+		set_led(16, wscolor_yellow)
+		set_led(17, wscolor_yellow)
+		set_led(18, wscolor_yellow)
 
 		# F1-F4 buttons
-		if self.zyngui.alt_mode:
+		if alt_mode:
 			wscolor_fx = self.wscolor_alt
 		else:
-			wscolor_fx = self.wscolor_default
-		self.wsleds[4] = wscolor_fx
-		self.wsleds[11] = wscolor_fx
-		self.wsleds[12] = wscolor_fx
-		self.wsleds[19] = wscolor_fx
+			wscolor_fx = wscolor_default
+		set_led(4, wscolor_fx)
+		set_led(11, wscolor_fx)
+		set_led(12, wscolor_fx)
+		set_led(19, wscolor_fx)
 
 		# Call current screen's update_wsleds() function to update the customizable LEDs
-		update_wsleds_func = getattr(curscreen_obj, "update_wsleds", None)
-		if callable(update_wsleds_func):
+		update_wsleds_func = self.get_screen_wsleds_cb(curscreen, curscreen_obj)
+		if update_wsleds_func:
 			update_wsleds_func(self.custom_wsleds)
 
-		# Refresh LED strip
-		try:
-			self.zyngui.screens[curscreen].update_wsleds()
-		except:
-			pass
-
 # ------------------------------------------------------------------------------
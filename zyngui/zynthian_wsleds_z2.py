@@ -33,7 +33,24 @@ from zyngui import zynthian_gui_config
 
 
 class zynthian_wsleds_z2(zynthian_wsleds_base):
-	
+
+	# Chain buttons 1-6 map to chains 1-5 plus the main chain
+	CHAIN_IDS = (1, 2, 3, 4, 5, 0)
+	# Screen-indicator LEDs, all defaulted each frame except the mapped one
+	SCREEN_LEDS = (8, 9, 10, 11, 12, 24)
+	# Map of screen name => (LED, highlight color attribute)
+	SCREEN_LED_MAP = {
+		"zynpad": (8, "wscolor_active"),
+		"pattern_editor": (9, "wscolor_active"),
+		"arranger": (9, "wscolor_active2"),
+		"control": (10, "wscolor_active"),
+		"audio_player": (10, "wscolor_active"),
+		"zs3": (11, "wscolor_active"),
+		"snapshot": (11, "wscolor_active2"),
+		"audio_mixer": (24, "wscolor_active"),
+		"alsa_mixer": (24, "wscolor_active2"),
+	}
+
 	def __init__(self, zyngui):
 		super().__init__(zyngui)
 		self.num_leds = 25
@@ -46,142 +63,129 @@ class zynthian_wsleds_z2(zynthian_wsleds_base):
 		self.custom_wsleds = [13, 14, 17, 15, 19, 21, 22, 23, 18, 20, 8, 9, 10, 11, 12]
 
 	def update_wsleds(self):
-		curscreen = self.zyngui.current_screen
-		curscreen_obj = self.zyngui.get_current_screen_obj()
+		# Hoist the per-frame lookups - this runs at the refresh rate and every
+		# self.zyngui.x.y chain costs repeated attribute/dict probes
+		zyngui = self.zyngui
+		state_manager = zyngui.state_manager
+		chain_manager = zyngui.chain_manager
+		set_led = self.set_led
+		blink_state = self.blink_state
+		alt_mode = zyngui.alt_mode
+		curscreen = zyngui.current_screen
+		curscreen_obj = zyngui.get_current_screen_obj()
+		wscolor_off = self.wscolor_off
+		wscolor_default = self.wscolor_default
+		wscolor_active = self.wscolor_active
+		wscolor_active2 = self.wscolor_active2
+		wscolor_red = self.wscolor_red
+		wscolor_green = self.wscolor_green
+		wscolor_yellow = self.wscolor_yellow
 
 		# Menu
-		if self.zyngui.is_current_screen_menu():
-			self.wsleds[0] = self.wscolor_active
-		elif self.zyngui.is_current_screen_admin():
-			self.wsleds[0] = self.wscolor_active2
+		if zyngui.is_current_screen_menu():
+			set_led(0, wscolor_active)
+		elif zyngui.is_current_screen_admin():
+			set_led(0, wscolor_active2)
 		else:
-			self.wsleds[0] = self.wscolor_default
+			set_led(0, wscolor_default)
 
 		# Active Chain
-		if self.zyngui.alt_mode:
+		if alt_mode:
 			wscolor_light = self.wscolor_alt
 		else:
-			wscolor_light = self.wscolor_default
+			wscolor_light = wscolor_default
 
 		# => Light non-empty chains
-		for i, chain_id in enumerate([1, 2, 3, 4, 5, 0]):
-			if self.zyngui.chain_manager.get_chain(chain_id) is None:
-				self.wsleds[i + 1] = self.wscolor_off
-			else:
-				if self.zyngui.chain_manager.active_chain_id == chain_id:
-					# => Light active chain
-					if curscreen == "control":
-						self.wsleds[i + 1] = self.wscolor_active
-					else:
-						if self.zyngui.chain_manager.get_processor_count(chain_id):
-							self.blink(i + 1, self.wscolor_active)
-						else:
-							self.blink(i + 1, self.wscolor_active2)
+		get_chain = chain_manager.get_chain
+		active_chain_id = chain_manager.active_chain_id
+		for i, chain_id in enumerate(self.CHAIN_IDS):
+			if get_chain(chain_id) is None:
+				set_led(i + 1, wscolor_off)
+			elif chain_id == active_chain_id:
+				# => Light active chain
+				if curscreen == "control":
+					set_led(i + 1, wscolor_active)
+				elif not blink_state:
+					set_led(i + 1, wscolor_off)
+				elif chain_manager.get_processor_count(chain_id):
+					set_led(i + 1, wscolor_active)
 				else:
-					self.wsleds[i + 1] = wscolor_light
+					set_led(i + 1, wscolor_active2)
+			else:
+				set_led(i + 1, wscolor_light)
 
 		# MODE button => MIDI LEARN
-		if self.zyngui.state_manager.get_midi_learn_zctrl() or curscreen == "zs3":
-			self.wsleds[7] = self.wscolor_yellow
-		elif self.zyngui.state_manager.midi_learn_zctrl:
-			self.wsleds[7] = self.wscolor_active
-		else:
-			self.wsleds[7] = self.wscolor_default
-
-		# Zynpad screen:
-		if curscreen == "zynpad":
-			self.wsleds[8] = self.wscolor_active
-		else:
-			self.wsleds[8] = self.wscolor_default
-
-		# Pattern Editor/Arranger screen:
-		if curscreen == "pattern_editor":
-			self.wsleds[9] = self.wscolor_active
-		elif curscreen == "arranger":
-			self.wsleds[9] = self.wscolor_active2
+		if state_manager.get_midi_learn_zctrl() or curscreen == "zs3":
+			set_led(7, wscolor_yellow)
+		elif state_manager.midi_learn_zctrl:
+			set_led(7, wscolor_active)
 		else:
-			self.wsleds[9] = self.wscolor_default
-
-		# Control / Preset Screen:
-		if curscreen in ("control", "audio_player"):
-			self.wsleds[10] = self.wscolor_active
+			set_led(7, wscolor_default)
+
+		# Screen-indicator LEDs (zynpad, pattern editor/arranger, control/preset,
+		# ZS3/snapshot, audio/ALSA mixer): one dict lookup instead of a chain of
+		# string comparisons, then default the remaining LEDs
+		mapped = self.SCREEN_LED_MAP.get(curscreen)
+		if mapped:
+			led, color_name = mapped
+			set_led(led, getattr(self, color_name))
 		elif curscreen in ("preset", "bank"):
-			if self.zyngui.current_processor.get_show_fav_presets():
-				self.blink(10, self.wscolor_active2)
+			led = 10
+			if blink_state or not zyngui.current_processor.get_show_fav_presets():
+				set_led(10, wscolor_active2)
 			else:
-				self.wsleds[10] = self.wscolor_active2
-		else:
-			self.wsleds[10] = self.wscolor_default
-
-		# ZS3/Snapshot screen:
-		if curscreen == "zs3":
-			self.wsleds[11] = self.wscolor_active
-		elif curscreen == "snapshot":
-			self.wsleds[11] = self.wscolor_active2
+				set_led(10, wscolor_off)
 		else:
-			self.wsleds[11] = self.wscolor_default
-
-		# ???:
-		self.wsleds[12] = self.wscolor_default
+			led = None
+		for i in self.SCREEN_LEDS:
+			if i != led:
+				set_led(i, wscolor_default)
 
 		# ALT button:
-		if self.zyngui.alt_mode:
-			self.wsleds[13] = self.wscolor_alt
+		if alt_mode:
+			set_led(13, self.wscolor_alt)
 		else:
-			self.wsleds[13] = self.wscolor_default
+			set_led(13, wscolor_default)
 
-		if self.zyngui.alt_mode and curscreen != "midi_recorder":
-			self.zyngui.screens["midi_recorder"].update_wsleds(wsleds)
+		if alt_mode and curscreen != "midi_recorder":
+			zyngui.screens["midi_recorder"].update_wsleds(self.custom_wsleds)
 		else:
 			# REC Button
-			if self.zyngui.state_manager.audio_recorder.rec_proc:
-				self.wsleds[14] = self.wscolor_red
+			if state_manager.audio_recorder.rec_proc:
+				set_led(14, wscolor_red)
 			else:
-				self.wsleds[14] = self.wscolor_default
+				set_led(14, wscolor_default)
 			# STOP button
-			self.wsleds[17] = self.wscolor_default
+			set_led(17, wscolor_default)
 			# PLAY button:
-			if self.zyngui.state_manager.status_audio_player:
-				self.wsleds[15] = self.wscolor_green
+			if state_manager.status_audio_player:
+				set_led(15, wscolor_green)
 			else:
-				self.wsleds[15] = self.wscolor_default
+				set_led(15, wscolor_default)
 
 		# Tempo Screen
 		if curscreen == "tempo":
-			self.wsleds[16] = self.wscolor_active
-		elif self.zyngui.state_manager.zynseq.libseq.isMetronomeEnabled():
-			self.blink(16, self.wscolor_active)
+			set_led(16, wscolor_active)
+		elif state_manager.zynseq.libseq.isMetronomeEnabled():
+			set_led(16, wscolor_active if blink_state else wscolor_off)
 		else:
-			self.wsleds[16] = self.wscolor_default
+			set_led(16, wscolor_default)
 
 		# Select/Yes button
-		self.wsleds[20] = self.wscolor_green
+		set_led(20, wscolor_green)
 
 		# Back/No button
-		self.wsleds[18] = self.wscolor_red
+		set_led(18, wscolor_red)
 
 		# Arrow buttons (Up, Left, Bottom, Right)
-		self.wsleds[19] = self.wscolor_yellow
-		self.wsleds[21] = self.wscolor_yellow
-		self.wsleds[22] = self.wscolor_yellow
-		self.wsleds[23] = self.wscolor_yellow
-
-		# Audio Mixer / ALSA Mixer
-		if curscreen == "audio_mixer":
-			self.wsleds[24] = self.wscolor_active
-		elif curscreen == "alsa_mixer":
-			self.wsleds[24] = self.wscolor_active2
-		else:
-			self.wsleds[24] = self.wscolor_default
+		set_led(19, wscolor_yellow)
+		set_led(21, wscolor_yellow)
+		set_led(22, wscolor_yellow)
+		set_led(23, wscolor_yellow)
 
 		# Call current screen's update_wsleds() function to update the customizable LEDs
-		update_wsleds_func = getattr(curscreen_obj, "update_wsleds", None)
-		if callable(update_wsleds_func):
+		update_wsleds_func = self.get_screen_wsleds_cb(curscreen, curscreen_obj)
+		if update_wsleds_func:
 			update_wsleds_func(self.custom_wsleds)
 
-		try:
-			self.zyngui.screens[curscreen].update_wsleds()
-		except:
-			pass
-
 # ------------------------------------------------------------------------------